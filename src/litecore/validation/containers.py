@@ -1,10 +1,12 @@
 import collections.abc
 import functools
+import itertools
 
 from typing import (
     Any,
     Callable,
     Mapping,
+    Optional,
     Sequence,
     Type,
     Union,
@@ -12,10 +14,15 @@ from typing import (
 
 import litecore.validation.base as base
 import litecore.validation.length as length
+import litecore.validation.strings as strings
 import litecore.validation.exceptions as exc
 
 TemplateType = Union[base.Validator, Type, Callable[[Any], Any]]
 
+# Exact types accepted without going through the ABC isinstance checks
+_FAST_SEQUENCE_TYPES = (list, tuple)
+_FAST_MAPPING_TYPES = (dict,)
+
 
 def _validate_template_value(template: Callable[[Any], Any], value: Any) -> Any:
     return template(value)
@@ -27,11 +34,39 @@ def _validate_template_type(template: Type, value: Any) -> Any:
     return value
 
 
+def _all_valid(value: Sequence) -> bool:
+    return True
+
+
+def _all_match(match: Callable[[Any], Any], value: Sequence) -> bool:
+    return all(map(match, value))
+
+
+def _all_instances(template: Type, value: Sequence) -> bool:
+    return all(map(isinstance, value, itertools.repeat(template)))
+
+
+def _template_type(template: TemplateType) -> Optional[Type]:
+    return template if isinstance(template, type) else None
+
+
+def _make_batch_check(
+        template: TemplateType,
+) -> Optional[Callable[[Sequence], bool]]:
+    if isinstance(template, type):
+        return functools.partial(_all_instances, template)
+    if type(template) is base.Anything and template.hook is None:
+        return _all_valid
+    if type(template) is strings.RegEx and template.hook is None:
+        return functools.partial(_all_match, template._compiled.match)
+    return None
+
+
 @base.abstractslots(base.combine_slots(
     length.HasLength,
     base.Nullable,
     base.Validator,
-) + ('template', '_validate_template',))
+) + ('template', '_validate_template', '_template_type',))
 class Collection(length.HasLength, base.Nullable, base.Validator):
     __slots__ = ()
 
@@ -53,6 +88,7 @@ class Collection(length.HasLength, base.Nullable, base.Validator):
             func,
             self.template,
         )
+        self._template_type = _template_type(self.template)
 
 
 class Sequence(Collection):
@@ -83,7 +119,11 @@ class Sequence(Collection):
     litecore.validation.exceptions.MinLengthError: value [9] has length 1 < bound 2
 
     """
-    __slots__ = base.get_slots(Collection) + ('unique', 'result_factory',)
+    __slots__ = base.get_slots(Collection) + (
+        'unique',
+        'result_factory',
+        '_batch_check',
+    )
 
     def __init__(
             self,
@@ -95,37 +135,78 @@ class Sequence(Collection):
         super().__init__(**kwargs)
         self.unique = bool(unique)
         self.result_factory = result_factory
+        self._batch_check = _make_batch_check(self.template)
+
+    def _vectorized_validate(self, value: Any) -> Optional[Any]:
+        """Validate all items in a single pass, if possible.
+
+        Only applies to templates which return each item unchanged when it
+        passes validation (e.g., a type, Anything or a bare RegEx). Returns
+        None if the fast path does not apply or any item fails, in which case
+        the caller should fall back to item-by-item validation to collect the
+        errors.
+
+        Examples:
+
+        >>> long_values = list(range(10000))
+        >>> result = Sequence(template=int)(long_values)
+        >>> len(result)
+        10000
+        >>> result == long_values
+        True
+
+        """
+        if self._batch_check is None or self.unique:
+            return None
+        if self._batch_check(value):
+            return self.result_factory(value)
+        return None
 
     def _validate_items(self, value: Any) -> Any:
+        results = self._vectorized_validate(value)
+        if results is not None:
+            return results
         results = []
         errors = []
-        if self.unique:
+        # Bind loop-invariant lookups to locals for the per-item loop
+        validate = self._validate_template
+        template_type = self._template_type
+        save = results.append
+        save_error = errors.append
+        unique = self.unique
+        if unique:
             hashable_seen = set()
             saw_hashable = hashable_seen.add
             unhashable_seen = []
             saw_unhashable = unhashable_seen.append
         for index, item in enumerate(value):
             caught_err = None
-            try:
-                item = self._validate_template(item)
-            except exc.ValidationValueError as err:
-                caught_err = exc.ContainerItemValueError(item, index, err)
-            except exc.ValidationTypeError as err:
-                caught_err = exc.ContainerItemTypeError(item, index, None, err)
-            except exc.SimpleTypeError as err:
-                caught_err = err
+            if template_type is not None:
+                # Type templates are probed directly, without raising
+                if not isinstance(item, template_type):
+                    caught_err = exc.SimpleTypeError(item, template_type)
+            else:
+                try:
+                    item = validate(item)
+                except exc.ValidationValueError as err:
+                    caught_err = exc.ContainerItemValueError(item, index, err)
+                except exc.ValidationTypeError as err:
+                    caught_err = exc.ContainerItemTypeError(
+                        item, index, None, err)
+                except exc.SimpleTypeError as err:
+                    caught_err = err
             if caught_err is not None:
-                errors.append(caught_err)
+                save_error(caught_err)
                 continue
-            if self.unique:
+            if unique:
                 if item in hashable_seen or item in unhashable_seen:
                     err = exc.NonUniqueContainerItemError(item, index)
-                    errors.append(err)
+                    save_error(err)
                 try:
                     saw_hashable(item)
                 except TypeError:
                     saw_unhashable(item)
-            results.append(item)
+            save(item)
         if not errors:
             if not isinstance(results, self.result_factory):
                 results = self.result_factory(results)
@@ -134,7 +215,9 @@ class Sequence(Collection):
             raise exc.ContainerValidationError(value, self, errors)
 
     def _validate(self, value: Any) -> Any:
-        if isinstance(value, (str, bytes, bytearray)) or (
+        if type(value) in _FAST_SEQUENCE_TYPES:
+            pass
+        elif isinstance(value, (str, bytes, bytearray)) or (
                 not isinstance(value, collections.abc.Sequence)):
             raise exc.ContainerTypeError(value, self)
         results = self._validate_items(value)
@@ -145,6 +228,7 @@ class Mapping(Collection):
     __slots__ = base.get_slots(Collection) + (
         'key_template',
         '_validate_key_template',
+        '_key_template_type',
         'result_factory',
     )
 
@@ -166,35 +250,56 @@ class Mapping(Collection):
             func,
             self.key_template,
         )
+        self._key_template_type = _template_type(self.key_template)
 
     def _validate_items(self, value: Any) -> Any:
         results = []
         errors = []
+        validate_key = self._validate_key_template
+        validate_value = self._validate_template
+        key_type = self._key_template_type
+        value_type = self._template_type
+        save = results.append
+        save_error = errors.append
         for item_key, item_value in value.items():
             caught_key_err = None
             caught_value_err = None
-            try:
-                item_key = self._validate_key_template(item_key)
-            except exc.ValidationError as err:
-                caught_key_err = exc.ContainerItemKeyError(
-                    item_value, item_key, err)
+            # Type templates are probed directly, without raising
+            if key_type is not None:
+                if not isinstance(item_key, key_type):
+                    caught_key_err = exc.ContainerItemKeyError(
+                        item_value,
+                        item_key,
+                        exc.SimpleTypeError(item_key, key_type),
+                    )
+            else:
+                try:
+                    item_key = validate_key(item_key)
+                except exc.ValidationError as err:
+                    caught_key_err = exc.ContainerItemKeyError(
+                        item_value, item_key, err)
             if caught_key_err is not None:
-                errors.append(caught_key_err)
-            try:
-                item_value = self._validate_template(item_value)
-            except exc.ValidationValueError as err:
-                caught_value_err = exc.ContainerItemValueError(
-                    item_value, item_key, err)
-            except exc.ValidationTypeError as err:
-                caught_value_err = exc.ContainerItemTypeError(
-                    item_value, item_key, None, err)
-            except exc.SimpleTypeError as err:
-                caught_value_err = err
+                save_error(caught_key_err)
+            if value_type is not None:
+                if not isinstance(item_value, value_type):
+                    caught_value_err = exc.SimpleTypeError(
+                        item_value, value_type)
+            else:
+                try:
+                    item_value = validate_value(item_value)
+                except exc.ValidationValueError as err:
+                    caught_value_err = exc.ContainerItemValueError(
+                        item_value, item_key, err)
+                except exc.ValidationTypeError as err:
+                    caught_value_err = exc.ContainerItemTypeError(
+                        item_value, item_key, None, err)
+                except exc.SimpleTypeError as err:
+                    caught_value_err = err
             if caught_value_err is not None:
-                errors.append(caught_value_err)
+                save_error(caught_value_err)
             if caught_key_err or caught_value_err:
                 continue
-            results.append((item_key, item_value))
+            save((item_key, item_value))
         if not errors:
             results = self.result_factory(results)
             return results
@@ -202,7 +307,8 @@ class Mapping(Collection):
             raise exc.ContainerValidationError(value, self, errors)
 
     def _validate(self, value: Any) -> Any:
-        if not isinstance(value, collections.abc.Mapping):
+        if type(value) not in _FAST_MAPPING_TYPES and (
+                not isinstance(value, collections.abc.Mapping)):
             raise exc.ContainerTypeError(value, self)
         results = self._validate_items(value)
         return super()._validate(results)
@@ -12,7 +12,6 @@ class Length(base.Validator):
         'exactly',
         'at_least',
         'at_most',
-        '_validator',
     )
 
     def __init__(
@@ -39,41 +38,39 @@ class Length(base.Validator):
         self.exactly = exactly
         self.at_least = at_least
         self.at_most = at_most
-        if exactly is not None:
-            self._validator = base.Constant(value=exactly)
-        else:
-            self._validator = base.Between(lower=at_least, upper=at_most)
 
-        def _check_arg(self, arg) -> int:
-            orig = arg
-            try:
-                arg = int(arg)
-            except Exception as err:
-                msg = f'{orig!r} cannot be interpreted as an integer'
-                raise TypeError(msg) from err
-            if arg != orig:
-                msg = f'{orig!r} is not integral'
-                raise ValueError(msg)
-            if arg < 0:
-                msg = f'lengths cannot be negative'
-                raise ValueError(msg)
-            return arg
+    def _check_arg(self, arg) -> int:
+        orig = arg
+        try:
+            arg = int(arg)
+        except Exception as err:
+            msg = f'{orig!r} cannot be interpreted as an integer'
+            raise TypeError(msg) from err
+        if arg != orig:
+            msg = f'{orig!r} is not integral'
+            raise ValueError(msg)
+        if arg < 0:
+            msg = f'lengths cannot be negative'
+            raise ValueError(msg)
+        return arg
 
     def _validate(self, value: Any) -> Any:
         try:
-            len(value)
+            size = len(value)
         except TypeError as err:
             msg = f'{value!r} has no len()'
             args = (value, self, None, err, msg)
             raise exc.ValidationTypeError(*args) from err
-        try:
-            self._validator(value)
-        except exc.LowerBoundError:
-            raise exc.MinLengthError(value, self)
-        except exc.UpperBoundError:
-            raise exc.MaxLengthError(value, self)
-        except exc.ConstantError:
-            raise exc.LengthError(value, self)
+        # Lengths and bounds are both ints, so compare them directly rather
+        # than through nested bound validators
+        if self.exactly is not None:
+            if size != self.exactly:
+                raise exc.LengthError(value, self)
+        else:
+            if self.at_least is not None and size < self.at_least:
+                raise exc.MinLengthError(value, self)
+            if self.at_most is not None and size > self.at_most:
+                raise exc.MaxLengthError(value, self)
         return super()._validate(value)
 
 
@@ -71,11 +71,15 @@ class Choices(IncludedValueValidator):
     litecore...ChoiceError: invalid value 'David'; ...
 
     """
-    __slots__ = base.get_slots(IncludedValueValidator)
+    __slots__ = base.get_slots(IncludedValueValidator) + ('_lookup',)
     _validate_values = _validate_choices
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._lookup = frozenset(self.values)
+
     def _validate(self, value: Any) -> Any:
-        if value not in self.values:
+        if value not in self._lookup:
             raise exc.ChoiceError(value, self)
         return value
 
@@ -137,11 +141,15 @@ class Excluded(ExcludedValueValidator):
     Examples:
 
     """
-    __slots__ = base.get_slots(ExcludedValueValidator)
+    __slots__ = base.get_slots(ExcludedValueValidator) + ('_lookup',)
     _validate_values = _validate_choices
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._lookup = frozenset(self.values)
+
     def _validate(self, value: Any) -> Any:
-        if value in self.values:
+        if value in self._lookup:
             raise exc.ExcludedChoiceError(value, self)
         return value
 
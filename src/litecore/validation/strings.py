@@ -1,4 +1,5 @@
 import abc
+import codecs
 import re
 
 from typing import (
@@ -18,6 +19,7 @@ class RegEx(base.Validator):
         'pattern',
         'flags',
         '_compiled',
+        '_match',
     )
 
     def __init__(
@@ -34,9 +36,10 @@ class RegEx(base.Validator):
             self._compiled = pattern
         else:
             self._compiled = re.compile(pattern, flags)
+        self._match = self._compiled.match
 
     def _validate(self, value: Any) -> Any:
-        if not re.match(self._compiled, value):
+        if not self._match(value):
             raise exc.PatternError(value, self)
         return super()._validate(value)
 
@@ -67,7 +70,7 @@ class String(HasRegEx, length.HasLength, specified.SimpleChoices):
     Examples:
 
     """
-    __slots__ = ('encoding',) + base.combine_slots(
+    __slots__ = ('encoding', '_decode') + base.combine_slots(
         HasRegEx,
         length.HasLength,
         specified.SimpleChoices,
@@ -80,13 +83,18 @@ class String(HasRegEx, length.HasLength, specified.SimpleChoices):
             encoding: Optional[str] = 'utf-8',
             **kwargs,
     ) -> None:
+        if encoding is not None:
+            decode = codecs.lookup(encoding).decode
+        else:
+            decode = None
         super().__init__(**kwargs)
         self.encoding = encoding
+        self._decode = decode
 
     def _validate(self, value: Any) -> Any:
-        if isinstance(value, bytes) and self.encoding is not None:
+        if isinstance(value, bytes) and self._decode is not None:
             try:
-                value = value.decode(self.encoding)
+                value, _ = self._decode(value)
             except UnicodeDecodeError as err:
                 args = (value, self, str, err)
                 raise exc.ValidationTypeError(*args) from err
@@ -5,30 +5,62 @@ from typing import (
     Union,
 )
 
-DATE_RE = re.compile(r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})$')
+DATE_RE = re.compile(
+    r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})$',
+    re.ASCII,
+)
 
 TIME_RE = re.compile(
     r'(?P<hour>\d{1,2}):(?P<minute>\d{1,2})'
-    r'(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?'
+    r'(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?',
+    re.ASCII,
 )
 
 DATETIME_RE = re.compile(
     r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})'
     r'[T ](?P<hour>\d{1,2}):(?P<minute>\d{1,2})'
     r'(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?'
-    r'(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$'
+    r'(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$',
+    re.ASCII,
 )
 
 
 def parse_date(value: Union[dt.date, dt.datetime, str]) -> dt.date:
-    if isinstance(value, dt.date):
-        return value
+    """Parse a date from a date, datetime or ISO-like string.
+
+    Strings must have the form YYYY-MM-DD; months and days may also be
+    unpadded. The format is checked with a regular expression, so the
+    accepted strings do not depend on the Python version.
+
+    Examples:
+
+    >>> parse_date('2018-07-04')
+    datetime.date(2018, 7, 4)
+    >>> parse_date('2018-7-4')
+    datetime.date(2018, 7, 4)
+    >>> parse_date(dt.datetime(2018, 7, 4, 12, 30))
+    datetime.date(2018, 7, 4)
+    >>> parse_date('July 4, 2018')
+    Traceback (most recent call last):
+     ...
+    ValueError: invalid date format 'July 4, 2018'
+    >>> parse_date('20180704')
+    Traceback (most recent call last):
+     ...
+    ValueError: invalid date format '20180704'
+
+    """
     if isinstance(value, dt.datetime):
         return value.date()
+    if isinstance(value, dt.date):
+        return value
     try:
         match = DATE_RE.match(value)
     except TypeError as err:
         msg = f'value should be a date/datetime or a string'
         raise ValueError(msg) from err
     if match is None:
-        
\ No newline at end of file
+        msg = f'invalid date format {value!r}'
+        raise ValueError(msg)
+    kwargs = {k: int(v) for k, v in match.groupdict().items()}
+    return dt.date(**kwargs)
@@ -1,7 +1,10 @@
 import functools
 import multiprocessing
+import os
+import queue
 import signal
-import time
+import threading
+import warnings
 
 from typing import (
     Callable,
@@ -51,6 +54,76 @@ def _try_func(queue, func, *args, **kwargs):
         queue.put((False, err))
 
 
+def _serve_calls(conn) -> None:
+    # worker process loop: run each (func, args, kwargs) received
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        except Exception as err:
+            # e.g., the function could not be unpickled in this process
+            conn.send((False, err))
+            continue
+        if task is None:
+            return
+        func, args, kwargs = task
+        try:
+            conn.send((True, func(*args, **kwargs)))
+        except Exception as err:
+            conn.send((False, err))
+
+
+class _Worker:
+    """Reusable process running one call at a time over a pipe."""
+    __slots__ = ('process', 'conn')
+
+    def __init__(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_serve_calls,
+            args=(child_conn,),
+        )
+        self.process.daemon = True
+        self.process.start()
+        child_conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.conn.close()
+
+    def terminate(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+
+_MAX_IDLE_WORKERS = os.cpu_count() or 1
+_idle_workers = []
+_workers_lock = threading.Lock()
+
+
+def _checkout_worker() -> _Worker:
+    with _workers_lock:
+        while _idle_workers:
+            worker = _idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.terminate()
+    return _Worker()
+
+
+def _checkin_worker(worker: _Worker) -> None:
+    with _workers_lock:
+        if len(_idle_workers) < _MAX_IDLE_WORKERS:
+            _idle_workers.append(worker)
+            return
+    worker.stop()
+
+
 class _TimeoutHandler:
     def __init__(
             self,
@@ -58,23 +131,29 @@ class _TimeoutHandler:
             *,
             timeout: int,
             message: str,
-            sleep: float,
+            sleep: Optional[float] = None,
+            reuse_workers: bool = False,
     ):
         self.func = func
         self.timeout = timeout
         self.message = message
+        # no longer used, since the result queue is waited on directly
         self.sleep = sleep
+        self.reuse_workers = reuse_workers
 
     def __repr__(self):
         return (
             f'<{type(self).__name__}('
             f'timeout={self.timeout}'
-            f'message={self.message}'
+            f', message={self.message}'
             f', sleep={self.sleep}'
+            f', reuse_workers={self.reuse_workers}'
             f')>'
         )
 
     def __call__(self, *args, **kwargs):
+        if self.reuse_workers:
+            return self._call_in_worker(*args, **kwargs)
         self.queue = multiprocessing.Queue(1)
         args = (self.queue, self.func) + args
         self.process = multiprocessing.Process(
@@ -83,13 +162,38 @@ class _TimeoutHandler:
             kwargs=kwargs,
         )
         self.process.daemon = True
-        limit_time = time.time() + self.timeout
         self.process.start()
-        while self.queue.empty():
-            if time.time() > limit_time:
-                self._terminate_and_raise()
-            time.sleep(self.sleep)
-        worked, result = self.queue.get()
+        # block until the child puts its result, rather than polling
+        try:
+            worked, result = self.queue.get(timeout=self.timeout)
+        except queue.Empty:
+            self._terminate_and_raise()
+        if worked:
+            return result
+        else:
+            raise result
+
+    def _call_in_worker(self, *args, **kwargs):
+        # each worker runs one call at a time, so on a timeout only the
+        # worker running this call is terminated
+        worker = _checkout_worker()
+        try:
+            worker.conn.send((self.func, args, kwargs))
+        except Exception:
+            # nothing was sent, so the worker is still usable
+            _checkin_worker(worker)
+            raise
+        try:
+            finished = worker.conn.poll(self.timeout)
+            if finished:
+                worked, result = worker.conn.recv()
+        except BaseException:
+            worker.terminate()
+            raise
+        if not finished:
+            worker.terminate()
+            raise TimeoutError(self.message)
+        _checkin_worker(worker)
         if worked:
             return result
         else:
@@ -105,8 +209,29 @@ def timeout_process(
         seconds: int,
         *,
         message: Optional[str] = None,
-        sleep: float = 0.01,
+        sleep: Optional[float] = None,
+        reuse_workers: bool = False,
 ) -> Callable:
+    """Decorator running a function in a separate process with a timeout.
+
+    By default, each call starts a new process. If reuse_workers is True,
+    calls are run by idle worker processes kept from earlier calls instead,
+    avoiding the process start-up cost per call. In that case the function and its
+    arguments must be picklable; in particular, the decorated function
+    must remain importable under its own name, so apply the decorator
+    without @ syntax (e.g., fast_f = timeout_process(1, ...)(f)). A worker
+    whose call times out is terminated; other calls are unaffected.
+
+    The sleep argument is deprecated and ignored: the result is waited on
+    directly, rather than polled every sleep seconds.
+
+    """
+    if sleep is not None:
+        warnings.warn(
+            'the sleep argument of timeout_process is deprecated and ignored',
+            DeprecationWarning,
+            stacklevel=2,
+        )
     if message is None:
         message = f'function timed out after {seconds} seconds'
 
@@ -117,7 +242,12 @@ def timeout_process(
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             handler = _TimeoutHandler(
-                func, timeout=seconds, message=message, sleep=sleep)
+                func,
+                timeout=seconds,
+                message=message,
+                sleep=sleep,
+                reuse_workers=reuse_workers,
+            )
             return handler(*args, **kwargs)
         return wrapper
     return decorator
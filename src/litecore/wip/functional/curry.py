@@ -1,3 +1,4 @@
+import functools
 
 
 class curry:
@@ -20,6 +21,15 @@ class curry:
     >>> to_upper = curried_map(str.upper)
     >>> ''.join(to_upper('test'))
     'TEST'
+    >>> curry(sorted).__doc__ == sorted.__doc__
+    True
+    >>> curry(sorted).__module__
+    'builtins'
+    >>> def f(a, b, c): return (a, b, c)
+    >>> c = curry(f, b=1)
+    >>> c.bind().keywords['b'] = 99
+    >>> c(0, c=0)
+    (0, 1, 0)
 
     """
 
@@ -33,10 +43,9 @@ class curry:
             args = func.args + args
             func = func.func
 
-        if kwargs:
-            self._partial = functools.partial(func, *args, **kwargs)
-        else:
-            self._partial = functools.partial(func, *args)
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
         self.__doc__ = getattr(func, '__doc__', None)
         self.__name__ = getattr(func, '__name__', f'<{type(self).__name__}>')
         self.__module__ = getattr(func, '__module__', None)
@@ -50,15 +59,15 @@ class curry:
 
     @property
     def func(self):
-        return self._partial.func
+        return self._func
 
     @property
     def args(self):
-        return self._partial.args
+        return self._args
 
     @property
     def keywords(self):
-        return self._partial.keywords
+        return self._kwargs
 
     def __repr__(self):
         return f'<{type(self).__name__} of {self.func}>'
@@ -72,16 +81,30 @@ class curry:
         )
 
     def __hash__(self):
-        frozen_kwargs = frozenset(
-            self.keywords.items() if self.keywords else None
-        )
+        frozen_kwargs = frozenset(self.keywords.items())
         return hash((self.func, self.args, frozen_kwargs))
 
     def bind(self, *args, **kwargs):
-        return type(self)(self, *args, **kwargs)
+        # Build the new curry directly from our own parts, rather than
+        # re-running __init__ and its partial/curry unwrapping.
+        cls = type(self)
+        bound = cls.__new__(cls)
+        bound._func = self._func
+        bound._args = self._args + args
+        # Always a new dict, since keywords exposes it to callers
+        bound._kwargs = {**self._kwargs, **kwargs}
+        bound.__doc__ = self.__doc__
+        bound.__name__ = self.__name__
+        bound.__module__ = self.__module__
+        bound.__qualname__ = self.__qualname__
+        bound.__annotations__ = self.__annotations__
+        return bound
 
     def __call__(self, *args, **kwargs):
         try:
-            return self._partial(*args, **kwargs)
+            if self._kwargs:
+                return self._func(
+                    *self._args, *args, **{**self._kwargs, **kwargs})
+            return self._func(*self._args, *args, **kwargs)
         except TypeError:
             return self.bind(*args, **kwargs)
@@ -30,6 +30,7 @@ class ArgsReversed:
     """Callable that reverses argument order of a two-argument callable.
 
     """
+    __slots__ = ('func',)
 
     def __init__(self, func):
         self.func = func
@@ -45,25 +46,66 @@ def reverse_args(func):
     return ArgsReversed(func)
 
 
+_MAX_SPECIALIZED_COMPOSITION = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _composition_factory(count: int) -> Callable[..., Callable]:
+    """Return a factory for specialized compositions of count functions.
+
+    The factory takes the functions in application order and returns a
+    closure applying them with nested calls, rather than a loop. The source
+    is compiled once per count.
+
+    """
+    names = tuple(f'f{i}' for i in range(count))
+    params = ', '.join(names)
+    body = '*args, **kwargs'
+    for name in names:
+        body = f'{name}({body})'
+    source = (
+        f'def factory({params}):\n'
+        f'    def composed(*args, **kwargs):\n'
+        f'        return {body}\n'
+        f'    return composed\n'
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace['factory']
+
+
 class Composition:
-    __slots__ = ('_first', '_rest')
+    __slots__ = ('_first', '_rest', '_call')
 
     def __init__(self, funcs: Iterable[Callable]):
         funcs = tuple(reversed(funcs))
         self._first = funcs[0]
         self._rest = funcs[1:]
+        self._specialize()
+
+    def _specialize(self):
+        # Every function after the first takes a single value, so long
+        # compositions are fused chunk by chunk into nested closures.
+        funcs = self.funcs
+        size = _MAX_SPECIALIZED_COMPOSITION
+        while len(funcs) > size:
+            funcs = tuple(
+                _composition_factory(len(chunk))(*chunk)
+                for chunk in (
+                    funcs[i:i + size] for i in range(0, len(funcs), size)
+                )
+            )
+        self._call = _composition_factory(len(funcs))(*funcs)
 
     def __call__(self, *args, **kwargs):
-        value = self._first(*args, **kwargs)
-        for func in self._rest:
-            value = func(value)
-        return value
+        return self._call(*args, **kwargs)
 
     def __getstate__(self):
         return self._first, self._rest
 
     def __setstate__(self, state):
         self._first, self._rest = state
+        self._specialize()
 
     @property
     def funcs(self):
@@ -107,15 +149,26 @@ def raises(func: Callable, exception: BaseException) -> bool:
 
 
 class Juxtaposition:
-    def __init__(self, funcs: Iterable[Callable]):
+    """Callable returning the results of several callables on the same args.
+
+    Results are returned as a tuple, unless lazy is True, in which case
+    they are computed on demand by a generator.
+
+    """
+    __slots__ = ('funcs', 'lazy')
+
+    def __init__(self, funcs: Iterable[Callable], *, lazy: bool = False):
         self.funcs = tuple(funcs)
+        self.lazy = bool(lazy)
 
     def __call__(self, *args, **kwargs):
-        return (f(*args, **kwargs) for f in self.funcs)
+        if self.lazy:
+            return (f(*args, **kwargs) for f in self.funcs)
+        return tuple([f(*args, **kwargs) for f in self.funcs])
 
     def __repr__(self):
-        return f'{type(self).__name__}(funcs={self.funcs})'
+        return f'{type(self).__name__}(funcs={self.funcs}, lazy={self.lazy})'
 
 
-def juxtapose(*funcs):
-    return Juxtaposition(funcs)
+def juxtapose(*funcs, lazy: bool = False):
+    return Juxtaposition(funcs, lazy=lazy)
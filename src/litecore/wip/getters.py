@@ -19,7 +19,10 @@ class GetColumnError(LitecoreError, ValueError):
 
 
 def _check_strict(data, fields, attrs, items):
-    if attrs is not _NO_VALUE and (items not in (_NO_VALUE, _NO_ITEM_GETTER)):
+    # Identity checks: "not in" builds a tuple and falls back to __eq__,
+    # which calls into arbitrary user code for the attribute/item values
+    have_item = items is not _NO_VALUE and items is not _NO_ITEM_GETTER
+    if attrs is not _NO_VALUE and have_item:
         msg = (
             f'data {data!r} has ambiguous attribute(s) and item(s) {fields!r} '
             f'with attribute value(s) {attrs!r} '
@@ -28,90 +31,181 @@ def _check_strict(data, fields, attrs, items):
         raise GetFieldError(msg)
 
 
-def _get_field_helper(
-    data: typing.Any,
-    *,
-    default: typing.Any = _NO_VALUE,
-    strict: bool = False,
-    _field: str,
-    _attr_getter: typing.Callable,
-    _item_getter: typing.Callable,
-):
-    try:
-        item_value = _item_getter(data)
-    except KeyError:
-        item_value = _NO_VALUE
-    except TypeError:
-        item_value = _NO_ITEM_GETTER
-    try:
-        attr_value = _attr_getter(data)
-    except AttributeError:
-        attr_value = _NO_VALUE
-    if strict:
-        _check_strict(data, _field, attr_value, item_value)
-    elif attr_value is not _NO_VALUE:
-        return attr_value
-    elif item_value not in (_NO_VALUE, _NO_ITEM_GETTER):
-        return item_value
-    if default is not _NO_VALUE:
-        return default
-    msg = (
-        f'data {data!r} does not have field {_field!r} '
-        f'and no default value provided'
-    )
-    raise GetFieldError(msg)
+def _probe_attr(data: typing.Any, field: str, getter: typing.Callable):
+    if '.' in field:
+        # dotted fields are nested attribute lookups
+        try:
+            return getter(data)
+        except AttributeError:
+            return _NO_VALUE
+    return getattr(data, field, _NO_VALUE)
 
 
-def _get_single_field(
-    data: typing.Any,
-    field: str,
-    default: typing.Any,
-    getter: typing.Callable[[str], typing.Any],
-):
+def _probe_item(data: typing.Any, field: str, getter: typing.Callable):
+    if type(data) is dict:
+        return data.get(field, _NO_VALUE)
+    if not hasattr(type(data), '__getitem__'):
+        return _NO_ITEM_GETTER
     try:
         return getter(data)
-    except (AttributeError, KeyError):
-        return default
+    except KeyError:
+        return _NO_VALUE
+    except TypeError:
+        return _NO_ITEM_GETTER
 
 
-def _get_multiple_fields_helper(
-    data: typing.Any,
-    *,
-    default: typing.Any = _NO_VALUE,
-    strict: bool = False,
-    _all_attr_getter: typing.Callable,
-    _all_item_getter: typing.Callable,
-    _attr_getters: typing.Mapping[str, typing.Callable],
-    _item_getters: typing.Mapping[str, typing.Callable],
-):
-    fields = tuple(_attr_getters.keys())
+def _probe_all_items(data: typing.Any, getter: typing.Callable):
     try:
-        item_values = _all_item_getter(data)
+        return getter(data)
     except KeyError:
-        item_values = _NO_VALUE
+        return _NO_VALUE
     except TypeError:
-        item_values = _NO_ITEM_GETTER
-    try:
-        attr_values = _all_attr_getter(data)
-    except AttributeError:
-        attr_values = _NO_VALUE
-    if strict:
-        _check_strict(data, fields, attr_values, item_values)
-    elif attr_values is not _NO_VALUE:
-        return attr_values
-    elif item_values not in (_NO_VALUE, _NO_ITEM_GETTER):
-        return item_values
-    if default is not _NO_VALUE:
-        getters = _attr_getters if item_values is _NO_ITEM_GETTER else _item_getters
-        return tuple(
-            _get_single_field(data, field, default, getter)
-            for field, getter in getters.items()
-        )
+        return _NO_ITEM_GETTER
+
+
+def _missing_field_error(data: typing.Any, field: str) -> GetFieldError:
+    msg = (
+        f'data {data!r} does not have field {field!r} '
+        f'and no default value provided'
+    )
+    return GetFieldError(msg)
+
+
+def _missing_fields_error(data: typing.Any, fields: tuple) -> GetFieldError:
     msg = (
         f'data {data!r} does not have all fields {fields!r} '
         f'and no default value provided'
     )
-    raise GetFieldError(msg)
+    return GetFieldError(msg)
+
+
+# Templates for the specialized getter functions compiled by _getter_factory.
+# Build-time options become argument defaults, so a plain call binds no
+# keyword arguments at all. Field names and getters are closure variables,
+# never pasted into the source.
+_SINGLE_FIELD_TEMPLATE = """
+def factory(field, attr_getter, item_getter, default, strict):
+    def get(data, default=default, strict=strict):
+        value = {probe}
+        if strict:
+            item_value = _probe_item(data, field, item_getter)
+            _check_strict(data, field, value, item_value)
+        if value is not _NO_VALUE:
+            return value
+        if not strict:
+            item_value = _probe_item(data, field, item_getter)
+        if item_value is not _NO_VALUE and item_value is not _NO_ITEM_GETTER:
+            return item_value
+        if default is not _NO_VALUE:
+            return default
+        raise _missing_field_error(data, field)
+    return get
+"""
+
+_MULTIPLE_FIELDS_TEMPLATE = """
+def factory(fields, attr_getter, item_getter, default, strict, field_functions):
+    def get(data, default=default, strict=strict):
+        try:
+            value = attr_getter(data)
+        except AttributeError:
+            value = _NO_VALUE
+        if strict:
+            item_value = _probe_all_items(data, item_getter)
+            _check_strict(data, fields, value, item_value)
+        if value is not _NO_VALUE:
+            return value
+        if not strict:
+            item_value = _probe_all_items(data, item_getter)
+        if item_value is not _NO_VALUE and item_value is not _NO_ITEM_GETTER:
+            return item_value
+        if default is not _NO_VALUE:
+            return tuple([
+                get_field(data, default, False)
+                for get_field in field_functions
+            ])
+        raise _missing_fields_error(data, fields)
+    return get
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _getter_factory(multiple: bool, dotted: bool) -> typing.Callable:
+    """Compile (once per shape) a factory of specialized getter functions."""
+    if multiple:
+        source = _MULTIPLE_FIELDS_TEMPLATE
+    elif dotted:
+        source = _SINGLE_FIELD_TEMPLATE.format(
+            probe='_probe_attr(data, field, attr_getter)')
+    else:
+        source = _SINGLE_FIELD_TEMPLATE.format(
+            probe='getattr(data, field, _NO_VALUE)')
+    namespace = {
+        '_NO_VALUE': _NO_VALUE,
+        '_NO_ITEM_GETTER': _NO_ITEM_GETTER,
+        '_check_strict': _check_strict,
+        '_probe_attr': _probe_attr,
+        '_probe_item': _probe_item,
+        '_probe_all_items': _probe_all_items,
+        '_missing_field_error': _missing_field_error,
+        '_missing_fields_error': _missing_fields_error,
+    }
+    exec(source, namespace)
+    return namespace['factory']
+
+
+def _single_field_function(
+    field: str,
+    default: typing.Any,
+    strict: bool,
+) -> typing.Callable:
+    factory = _getter_factory(False, '.' in field)
+    return factory(
+        field,
+        operator.attrgetter(field),
+        operator.itemgetter(field),
+        default,
+        strict,
+    )
+
+
+class _FieldGetter:
+    """Callable returned by fieldgetter().
+
+    Wraps a specialized getter function, and pickles by reconstructing it.
+
+    """
+    def __init__(
+        self,
+        fields: typing.Tuple[str, ...],
+        options: typing.Tuple[typing.Tuple[str, typing.Any], ...],
+        get: typing.Callable,
+    ):
+        self.fields = fields
+        self._options = options
+        self._get = get
+
+    def __reduce__(self):
+        return (functools.partial(fieldgetter, **dict(self._options)), self.fields)
+
+    def __repr__(self):
+        return f'<fieldgetter of {self.fields!r}>'
+
+    def __call__(
+        self,
+        data: typing.Any,
+        default: typing.Any = _NO_VALUE,
+        strict: typing.Optional[bool] = None,
+    ):
+        # Explicit parameters rather than **kwargs: the common call with only
+        # data builds no keyword dictionary, and the options chosen when the
+        # getter was built remain in effect unless overridden here
+        if default is _NO_VALUE:
+            if strict is None:
+                return self._get(data)
+            return self._get(data, strict=strict)
+        if strict is None:
+            return self._get(data, default)
+        return self._get(data, default, strict)
 
 
 def fieldgetter(
@@ -120,7 +214,7 @@ def fieldgetter(
     strict: typing.Optional[bool] = None,
     name: typing.Optional[str] = None,
     doc: typing.Optional[str] = None,
-) -> functools.partial:
+) -> _FieldGetter:
     """
 
     Examples:
@@ -160,40 +254,35 @@ def fieldgetter(
     >>> new_hr_min_sec = pickle.loads(pickle.dumps(hr_min_sec))
     >>> [new_hr_min_sec(date, default=None) for date in dates] == results
     True
+    >>> fieldgetter('day') is day
+    False
+    >>> fieldgetter('day')._get is day._get
+    True
+    >>> fieldgetter('a', default=0.0)({})
+    0.0
+    >>> fieldgetter('a', default=-0.0)({})
+    -0.0
 
     """
-    if len(fields) > 1:
-        all_attr_getter = operator.attrgetter(*fields)
-        all_item_getter = operator.itemgetter(*fields)
-        attr_getters = collections.OrderedDict(
-            (field, operator.attrgetter(field)) for field in fields
-        )
-        item_getters = collections.OrderedDict(
-            (field, operator.itemgetter(field)) for field in fields
-        )
-        getter = functools.partial(
-            _get_multiple_fields_helper,
-            _all_attr_getter=all_attr_getter,
-            _all_item_getter=all_item_getter,
-            _attr_getters=attr_getters,
-            _item_getters=item_getters,
-        )
-    elif fields:
-        field = fields[0]
-        attr_getter = operator.attrgetter(field)
-        item_getter = operator.itemgetter(field)
-        getter = functools.partial(
-            _get_field_helper,
-            _field=field,
-            _attr_getter=attr_getter,
-            _item_getter=item_getter,
-        )
-    else:
+    if not fields:
         raise ValueError(f'expected at least one field')
+    if default is _NO_VALUE or default is None:
+        # Only these defaults are memoized: a user supplied default may be
+        # equal to, but distinct from, an earlier one (e.g. 0.0 and -0.0)
+        get = _cached_get_function(fields, default, bool(strict))
+    else:
+        get = _get_function(fields, default, bool(strict))
+    # Options as given, kept as (name, value) pairs for pickling
+    options = []
     if default is not _NO_VALUE:
-        getter = functools.partial(getter, default=default)
+        options.append(('default', default))
     if strict is not None:
-        getter = functools.partial(getter, strict=strict)
+        options.append(('strict', strict))
+    if name is not None:
+        options.append(('name', name))
+    if doc is not None:
+        options.append(('doc', doc))
+    getter = _FieldGetter(fields, tuple(options), get)
     if name is not None:
         getter.__name__ = name
     if doc is not None:
@@ -201,12 +290,43 @@ def fieldgetter(
     return getter
 
 
+def _get_function(
+    fields: typing.Tuple[str, ...],
+    default: typing.Any,
+    strict: bool,
+) -> typing.Callable:
+    if len(fields) > 1:
+        # Only consulted when some fields are missing and a default applies
+        field_functions = tuple(
+            _single_field_function(field, _NO_VALUE, False)
+            for field in fields
+        )
+        return _getter_factory(True, False)(
+            fields,
+            operator.attrgetter(*fields),
+            operator.itemgetter(*fields),
+            default,
+            strict,
+            field_functions,
+        )
+    return _single_field_function(fields[0], default, strict)
+
+
+_cached_get_function = functools.lru_cache(maxsize=512)(_get_function)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_nt(name: str, fields: tuple) -> typing.Type[tuple]:
+    return collections.namedtuple(name, fields, rename=True)
+
+
 class _NamedTupleMaker:
     def __init__(self, name, fields, getter):
         self.name = name
         self.fields = fields
         self._getter = getter
-        self._nt = collections.namedtuple(name, fields, rename=True)
+        self._single = len(fields) == 1
+        self._nt = _make_nt(name, tuple(fields))
 
     def __getstate__(self):
         return (self.name, self.fields, self._getter)
@@ -216,10 +336,8 @@ class _NamedTupleMaker:
 
     def __call__(self, data, **kwargs):
         items = self._getter(data, **kwargs)
-        try:
-            iter(items)
-        except TypeError:
-            items = (items,)
+        if self._single:
+            return self._nt._make((items,))
         return self._nt._make(items)
 
 
@@ -255,6 +373,8 @@ def namedtuple_fieldgetter(
     >>> hr_min = namedtuple_fieldgetter('hour', 'minute', class_name='TimeExample')
     >>> [hr_min(date) for date in dates]
     [TimeExample(hour=23, minute=45), TimeExample(hour=7, minute=50), TimeExample(hour=13, minute=5), TimeExample(hour=11, minute=25)]
+    >>> namedtuple_fieldgetter('hours', class_name='Hours')({'hours': [23, 7]})
+    Hours(hours=[23, 7])
     >>> hr_min_sec = namedtuple_fieldgetter('hour', 'minute', 'millisecond', class_name='TimeExample2')
     >>> [hr_min_sec(date) for date in dates]  # doctest: +ELLIPSIS
     Traceback (most recent call last):
@@ -277,13 +397,11 @@ def namedtuple_fieldgetter(
     return _NamedTupleMaker(class_name, fields, getter)
 
 
-def _record_maker(data, *, _fields, _getter, factory=dict, **kwargs):
+def _record_maker(data, *, _fields, _getter, _single, factory=dict, **kwargs):
     items = _getter(data, **kwargs)
-    try:
-        iter(items)
-    except TypeError:
-        items = (items,)
-    return factory((field, item) for field, item in zip(_fields, items))
+    if _single:
+        return factory(((_fields[0], items),))
+    return factory(zip(_fields, items))
 
 
 def record_fieldgetter(
@@ -319,6 +437,8 @@ def record_fieldgetter(
     >>> hr_min = record_fieldgetter('hour', 'minute')
     >>> [hr_min(date) for date in dates]  # doctest: +ELLIPSIS
     [{'hour': 23, 'minute': 45}, ..., {'hour': 11, 'minute': 25}]
+    >>> record_fieldgetter('hours')({'hours': [23, 7]})
+    {'hours': [23, 7]}
     >>> hr_min_sec = record_fieldgetter('hour', 'minute', 'millisecond')
     >>> [hr_min_sec(date) for date in dates]  # doctest: +ELLIPSIS
     Traceback (most recent call last):
@@ -340,7 +460,7 @@ def record_fieldgetter(
         _record_maker,
         _fields=fields,
         _getter=getter,
-        **kwargs,
+        _single=len(fields) == 1,
     )
     if factory is not None:
         getter = functools.partial(getter, factory=factory)
@@ -1,6 +1,8 @@
 import abc
 import collections
+import itertools
 import logging
+import operator
 
 from typing import (
     Iterable,
@@ -18,14 +20,31 @@ from litecore._types import KT, VT, HVT
 log = logging.getLogger(__name__)
 
 
+_key_of = operator.itemgetter(0)
+_value_of = operator.itemgetter(1)
+
+
 def make_sequence_mapping(
         *,
         mapping_factory: Type[MutableMapping] = collections.defaultdict,
         factory: Type[MutableSequence] = list,
         items: Optional[Iterable[Tuple[KT, VT]]] = None,
+        presorted: bool = False,
 ):
+    """Create a mapping of keys to sequences of values.
+
+    If presorted is True, items with equal keys are expected to be adjacent
+    (e.g., sorted by key), and each run is added with a single extend().
+    Keys which appear in more than one run are still handled correctly.
+
+    """
     mapping = mapping_factory(factory)
-    if items is not None:
+    if items is None:
+        return mapping
+    if presorted:
+        for key, group in itertools.groupby(items, key=_key_of):
+            mapping[key].extend(map(_value_of, group))
+    else:
         for key, value in items:
             mapping[key].append(value)
     return mapping
@@ -36,28 +55,45 @@ def make_set_mapping(
         mapping_factory: Type[MutableMapping] = collections.defaultdict,
         factory: Type[MutableSet] = set,
         items: Optional[Iterable[Tuple[KT, VT]]] = None,
+        presorted: bool = False,
 ):
+    """Create a mapping of keys to sets of values.
+
+    If presorted is True, items with equal keys are expected to be adjacent
+    (e.g., sorted by key), and each run is added with a single update().
+    Keys which appear in more than one run are still handled correctly.
+
+    """
     mapping = mapping_factory(factory)
-    if items is not None:
+    if items is None:
+        return mapping
+    if presorted:
+        for key, group in itertools.groupby(items, key=_key_of):
+            mapping[key].update(map(_value_of, group))
+    else:
         for key, value in items:
             mapping[key].add(value)
     return mapping
 
 
 class MultiMapping(collections.abc.Mapping):
+    # Set by subclasses to make_sequence_mapping() or make_set_mapping()
+    _create_mapping = None
+
     def __init__(
             self,
             *,
-            create_mapping,
             mapping_factory,
             factory,
             items,
+            presorted=False,
     ) -> None:
         self._factory = factory
-        self._mapping = create_mapping(
+        self._mapping = self._create_mapping(
             mapping_factory=mapping_factory,
             factory=factory,
             items=items,
+            presorted=presorted,
         )
 
     @property
@@ -66,18 +102,40 @@ class MultiMapping(collections.abc.Mapping):
 
     @property
     def len_all_items(self) -> int:
-        return sum(len(key_items) for key, key_items in self._mapping.items())
+        """Total number of values, over all keys.
+
+        Examples:
+
+        >>> m = MultiMutableSequenceMapping(items=[('a', 1), ('a', 2)])
+        >>> m['b'] = 3
+        >>> m['a'].append(4)
+        >>> m.len_all_items
+        4
+
+        """
+        # Counted on demand, since the containers returned by __getitem__
+        # can be changed directly
+        return sum(map(len, self._mapping.values()))
 
     @property
-    def all_items(self):
-        for key, key_items in self._mapping.items():
-            for item in key_items:
-                yield (key, item)
+    def all_items(self) -> Iterator[Tuple[KT, VT]]:
+        return itertools.chain.from_iterable(
+            zip(itertools.repeat(key, len(key_items)), key_items)
+            for key, key_items in self._mapping.items()
+        )
 
     @property
-    def all_values(self):
-        for key, value in self.all_items:
-            yield value
+    def all_values(self) -> Iterator[VT]:
+        return itertools.chain.from_iterable(self._mapping.values())
+
+    def __getitem__(self, key: KT) -> VT:
+        return self._mapping[key]
+
+    def __iter__(self) -> Iterator[Tuple[KT, VT]]:
+        return iter(self._mapping)
+
+    def __len__(self) -> int:
+        return len(self._mapping)
 
     def __repr__(self) -> str:
         return (
@@ -88,6 +146,18 @@ class MultiMapping(collections.abc.Mapping):
             f')'
         )
 
+    def _copy_frozen(self, frozen_factory):
+        # Immutable containers cannot be built up by the mapping builders,
+        # so copy with the usual containers and then freeze each of them
+        copied = self.copy()
+        mapping = copied._mapping
+        for key, key_items in mapping.items():
+            mapping[key] = frozen_factory(key_items)
+        if isinstance(mapping, collections.defaultdict):
+            mapping.default_factory = frozen_factory
+        copied._factory = frozen_factory
+        return copied
+
     @abc.abstractmethod
     def copy(self):
         pass
@@ -98,92 +168,96 @@ class MultiMapping(collections.abc.Mapping):
 
 
 class MultiMutableMapping(MultiMapping, collections.abc.MutableMapping):
-    pass
-
-
-class _MappingSharedMixin:
-    def __getitem__(self, key: KT) -> VT:
-        return self._mapping[key]
-
-    def __iter__(self) -> Iterator[Tuple[KT, VT]]:
-        return iter(self._mapping)
-
-    def __len__(self) -> int:
-        return len(self._mapping)
-
-
-class _MutableMappingSharedMixin:
     def __delitem__(self, key: KT):
         del self._mapping[key]
 
 
 class _SequenceMappingBaseMixin:
+    _create_mapping = staticmethod(make_sequence_mapping)
+
     def __init__(
             self,
             *,
             mapping_factory: Type[MutableMapping] = collections.defaultdict,
             factory: MutableSequence = list,
             items: Optional[Iterable[Tuple[KT, VT]]] = None,
+            presorted: bool = False,
     ) -> None:
         super().__init__(
-            create_mapping=make_sequence_mapping,
             mapping_factory=mapping_factory,
             factory=factory,
             items=items,
+            presorted=presorted,
         )
 
     def copy(self):
         return type(self)(
-            create_mapping=make_sequence_mapping,
             mapping_factory=type(self._mapping),
-            factory=type(self.factory),
+            factory=self.factory,
             items=self.all_items,
+            presorted=True,
         )
 
     def copy_frozen(self):
-        return type(self)(
-            create_mapping=make_sequence_mapping,
-            mapping_factory=type(self._mapping),
-            factory=tuple,
-            items=self.all_items,
-        )
+        """Copy, with each key's values in a tuple.
+
+        Examples:
+
+        >>> m = MultiSequenceMapping(items=[('a', 1), ('b', 2), ('a', 3)])
+        >>> frozen = m.copy_frozen()
+        >>> frozen['a'], frozen['b']
+        ((1, 3), (2,))
+        >>> frozen.factory
+        <class 'tuple'>
+
+        """
+        return self._copy_frozen(tuple)
 
 
 class _SetMappingBaseMixin:
+    _create_mapping = staticmethod(make_set_mapping)
+
     def __init__(
             self,
             *,
             mapping_factory: Type[MutableMapping] = collections.defaultdict,
             factory: MutableSet = set,
             items: Optional[Iterable[Tuple[KT, HVT]]] = None,
+            presorted: bool = False,
     ) -> None:
         super().__init__(
-            create_mapping=make_set_mapping,
             mapping_factory=mapping_factory,
             factory=factory,
             items=items,
+            presorted=presorted,
         )
 
     def copy(self):
         return type(self)(
-            create_mapping=make_set_mapping,
             mapping_factory=type(self._mapping),
-            factory=type(self.factory),
+            factory=self.factory,
             items=self.all_items,
+            presorted=True,
         )
 
     def copy_frozen(self):
-        return type(self)(
-            create_mapping=make_set_mapping,
-            mapping_factory=type(self._mapping),
-            factory=frozenset,
-            items=self.all_items,
-        )
+        """Copy, with each key's values in a frozenset.
+
+        Examples:
+
+        >>> m = MultiSetMapping(items=[('a', 1), ('b', 2), ('a', 1)])
+        >>> frozen = m.copy_frozen()
+        >>> frozen['a'], frozen['b']
+        (frozenset({1}), frozenset({2}))
+        >>> frozen.factory
+        <class 'frozenset'>
+
+        """
+        return self._copy_frozen(frozenset)
 
 
 class MultiSequenceMapping(
         _SequenceMappingBaseMixin,
-        _MappingSharedMixin,
         MultiMapping,
 ):
     pass
@@ -191,17 +265,18 @@ class MultiSequenceMapping(
 
 class MultiMutableSequenceMapping(
         _SequenceMappingBaseMixin,
-        _MutableMappingSharedMixin,
-        _MappingSharedMixin,
         MultiMutableMapping,
 ):
     def __setitem__(self, key: KT, value: VT):
-        self._mapping[key].append(value)
+        mapping = self._mapping
+        key_items = mapping.get(key)
+        if key_items is None:
+            key_items = mapping[key] = self._factory()
+        key_items.append(value)
 
 
 class MultiSetMapping(
         _SetMappingBaseMixin,
-        _MappingSharedMixin,
         MultiMapping,
 ):
     pass
@@ -209,9 +284,11 @@ class MultiSetMapping(
 
 class MultiMutableSetMapping(
         _SetMappingBaseMixin,
-        _MutableMappingSharedMixin,
-        _MappingSharedMixin,
         MultiMutableMapping,
 ):
     def __setitem__(self, key: KT, value: HVT):
-        self._mapping[key].add(value)
+        mapping = self._mapping
+        key_items = mapping.get(key)
+        if key_items is None:
+            key_items = mapping[key] = self._factory()
+        key_items.add(value)
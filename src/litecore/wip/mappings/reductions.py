@@ -2,8 +2,6 @@ from typing import (
     Mapping,
 )
 
-import litecore.sequences
-
 
 def is_one_to_one(mapping: Mapping) -> bool:
     """Returns True if a mapping has unique values.
@@ -15,6 +13,15 @@ def is_one_to_one(mapping: Mapping) -> bool:
     True
     >>> is_one_to_one({'a': 1, 'b': 2, 'c': 2})
     False
+    >>> is_one_to_one({'a': [1], 'b': [2], 'c': [1]})
+    False
 
     """
-    return litecore.sequences.all_distinct_items(mapping.values())
+    values = mapping.values()
+    try:
+        # Hashable values (the usual case) are deduplicated by set() in C
+        return len(set(values)) == len(values)
+    except TypeError:
+        seen = []
+        saw = seen.append
+        return not any(value in seen or saw(value) for value in values)
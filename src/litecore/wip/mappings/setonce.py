@@ -3,15 +3,12 @@ import collections
 import logging
 
 from litecore import LitecoreError as _ErrorBase
-import litecore.sentinel
 import litecore.diagnostics
 import litecore.mappings.base
 import litecore.mappings.classes
 
 log = logging.getLogger(__name__)
 
-_NOTHING = litecore.sentinel.create(name='_NOTHING')
-
 
 class DuplicateKeyError(_ErrorBase, ValueError):
     """Encountered an attempt to insert/update an already-existing key.
@@ -24,15 +21,17 @@ class DuplicateKeyError(_ErrorBase, ValueError):
 
 class SetKeyOnceMutableMapping(abc.ABC):
     def __setitem__(self, key, value) -> None:
-        existing = super().get(key, _NOTHING)
-        if existing is not _NOTHING:
+        # Work on the encapsulated mapping directly, rather than going through
+        # super().get() and super().__setitem__() on every insert
+        mapping = self._mapping
+        if key in mapping:
             msg = (
                 f'Key {key!r} is already set; '
-                f'value is {existing!r}; '
+                f'value is {mapping[key]!r}; '
                 f'attempted to set value to {value!r}'
             )
             raise DuplicateKeyError(msg)
-        super().__setitem__(key, value)
+        mapping[key] = value
 
     def force_overwrite(self, key, value) -> None:
         """Delete item if it exists and then add new item in its place."""
@@ -1,18 +1,52 @@
 import collections
+import collections.abc
 
 from typing import Type
 
 MappingFactory = Type[collections.abc.Mapping]
 MutableMappingFactory = Type[collections.abc.MutableMapping]
 
+# Common concrete mapping types, recognized without the (slower) ABC check
+_MAPPING_TYPES = frozenset({
+    dict,
+    collections.OrderedDict,
+    collections.defaultdict,
+})
+
 
 def deep_merge(original, new):
-    if (not isinstance(original, collections.abc.Mapping) or not
-            isinstance(new, collections.abc.Mapping)):
+    """Merge mapping new into mapping original, recursing into nested mappings.
+
+    The original mapping is updated in place and returned. If either argument
+    is not a mapping, new is returned.
+
+    Examples:
+
+    >>> original = {'a': 1, 'b': {'c': 2, 'd': 3}}
+    >>> deep_merge(original, {'b': {'d': 4, 'e': 5}, 'f': 6})
+    {'a': 1, 'b': {'c': 2, 'd': 4, 'e': 5}, 'f': 6}
+    >>> deep_merge(original, 7)
+    7
+
+    """
+    # Nested mappings are merged from an explicit stack rather than by
+    # recursion, so deeply nested inputs cannot exhaust the interpreter stack
+    Mapping = collections.abc.Mapping
+    mapping_types = _MAPPING_TYPES
+    if not isinstance(original, Mapping) or not isinstance(new, Mapping):
         return new
-    for key in new:
-        if key in original:
-            original[key] = deep_merge(original[key], new[key])
-        else:
-            original[key] = new[key]
+    stack = [(original, new)]
+    while stack:
+        target, source = stack.pop()
+        if target.keys().isdisjoint(source.keys()):
+            target.update(source)
+            continue
+        for key, value in source.items():
+            if key in target:
+                existing = target[key]
+                if type(existing) in mapping_types or isinstance(existing, Mapping):
+                    if type(value) in mapping_types or isinstance(value, Mapping):
+                        stack.append((existing, value))
+                        continue
+            target[key] = value
     return original
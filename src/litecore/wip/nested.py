@@ -2,8 +2,10 @@ import abc
 import collections.abc
 import dataclasses
 import enum
+import functools
 import inspect
-import itertools
+import types
+import weakref
 
 from typing import (
     Any,
@@ -13,12 +15,14 @@ from typing import (
     Iterator,
     List,
     Mapping,
+    MutableMapping,
     Optional,
     Tuple,
     Type,
     Union,
 )
 
+import litecore.objtype
 import litecore.utils
 from litecore.sentinels import NO_VALUE as _NO_VALUE
 
@@ -44,6 +48,22 @@ class ClassMarkerFlag(enum.Flag):
             obj: Any,
             *,
             primitives: Optional[Tuple[Type, ...]] = None,
+    ) -> 'ClassMarkerFlag':
+        # The flag only depends on the type of the object (and primitives),
+        # so the checks below run once per type, not once per object
+        flags = _type_flags(primitives)
+        flag = flags.get(type(obj))
+        if flag is None:
+            flag = flags[type(obj)] = cls._from_object_uncached(
+                obj, primitives=primitives)
+        return flag
+
+    @classmethod
+    def _from_object_uncached(
+            cls,
+            obj: Any,
+            *,
+            primitives: Optional[Tuple[Type, ...]] = None,
     ) -> 'ClassMarkerFlag':
         # TODO: handle ASTs?
         if litecore.utils.is_dataclass_instance(obj):
@@ -71,17 +91,138 @@ class ClassMarkerFlag(enum.Flag):
             return cls.NONE
 
 
+# Single flags grouped by how they are treated; membership tests on these
+# are much cheaper than ANDing enum.Flag values for every node
+_AS_LIST = frozenset({ClassMarkerFlag.SET, ClassMarkerFlag.SEQUENCE})
+_HAS_ATTRIBUTES = frozenset({
+    ClassMarkerFlag.CLASS,
+    ClassMarkerFlag.DATA_CLASS,
+    ClassMarkerFlag.NAMED_TUPLE,
+})
+_AS_DICT = _HAS_ATTRIBUTES | {ClassMarkerFlag.MAPPING}
+
+
+_BUILTIN_TYPE_FLAGS: Mapping[Type, ClassMarkerFlag] = types.MappingProxyType({
+    dict: ClassMarkerFlag.MAPPING,
+    list: ClassMarkerFlag.SEQUENCE,
+    tuple: ClassMarkerFlag.SEQUENCE,
+    set: ClassMarkerFlag.SET,
+    frozenset: ClassMarkerFlag.SET,
+    str: ClassMarkerFlag.NONE,
+    bytes: ClassMarkerFlag.NONE,
+    bytearray: ClassMarkerFlag.NONE,
+    int: ClassMarkerFlag.NONE,
+    float: ClassMarkerFlag.NONE,
+    bool: ClassMarkerFlag.NONE,
+    complex: ClassMarkerFlag.NONE,
+    type(None): ClassMarkerFlag.NONE,
+})
+_LEAF_TYPES = frozenset(
+    obj_type for obj_type, flag in _BUILTIN_TYPE_FLAGS.items()
+    if flag is ClassMarkerFlag.NONE
+)
+# Flags per type, weakly keyed so that classes can still be garbage
+# collected once they are no longer used, and reset whenever a class is
+# registered with an ABC (as functools.singledispatch does), since that
+# can change the flag of a type
+_TYPE_FLAGS: MutableMapping[Type, ClassMarkerFlag] = weakref.WeakKeyDictionary(
+    _BUILTIN_TYPE_FLAGS)
+_type_flags_token = abc.get_cache_token()
+
+
+@functools.lru_cache(maxsize=32)
+def _type_flags_with_primitives(
+        primitives: Tuple[Type, ...],
+) -> MutableMapping[Type, ClassMarkerFlag]:
+    return weakref.WeakKeyDictionary()
+
+
+def _type_flags(
+        primitives: Optional[Tuple[Type, ...]],
+) -> MutableMapping[Type, ClassMarkerFlag]:
+    global _type_flags_token
+    token = abc.get_cache_token()
+    if token != _type_flags_token:
+        _TYPE_FLAGS.clear()
+        _TYPE_FLAGS.update(_BUILTIN_TYPE_FLAGS)
+        _type_flags_with_primitives.cache_clear()
+        _type_flags_token = token
+    if primitives is None:
+        return _TYPE_FLAGS
+    return _type_flags_with_primitives(primitives)
+
+
+def make_classifier(
+        primitives: Optional[Tuple[Type, ...]] = None,
+) -> Callable[[Any], ClassMarkerFlag]:
+    """Return a function giving the ClassMarkerFlag of an object.
+
+    Equivalent to ClassMarkerFlag.from_object() with fixed primitives, but
+    looks up each object by its type alone. Meant to be created once per
+    traversal.
+
+    """
+    flags = _type_flags(primitives)
+    from_object = ClassMarkerFlag._from_object_uncached
+    get_cache_token = abc.get_cache_token
+    token = get_cache_token()
+    # Plain dict in front of the weakly keyed flags, for faster lookups;
+    # it only lives as long as the classifier
+    known = {}
+
+    def classifier(obj: Any) -> ClassMarkerFlag:
+        nonlocal flags, token
+        if get_cache_token() != token:
+            flags = _type_flags(primitives)
+            token = get_cache_token()
+            known.clear()
+        obj_type = type(obj)
+        flag = known.get(obj_type)
+        if flag is None:
+            flag = flags.get(obj_type)
+            if flag is None:
+                flag = flags[obj_type] = from_object(
+                    obj, primitives=primitives)
+            known[obj_type] = flag
+        return flag
+
+    return classifier
+
+
+def _filter_items_skip_private(
+        items: Iterator[Tuple[str, Any]],
+) -> Iterator[Tuple[Hashable, Any]]:
+    is_function = litecore.utils.is_function
+    for key, value in items:
+        if key[:1] == '_' or is_function(value):
+            continue
+        yield key, value
+
+
+def _filter_items_keep_private(
+        items: Iterator[Tuple[str, Any]],
+) -> Iterator[Tuple[Hashable, Any]]:
+    is_function = litecore.utils.is_function
+    for key, value in items:
+        if key[:2] == '__' or is_function(value):
+            continue
+        yield key, value
+
+
+def _items_filter(
+        skip_private: bool,
+) -> Callable[[Iterator[Tuple[str, Any]]], Iterator[Tuple[Hashable, Any]]]:
+    if skip_private:
+        return _filter_items_skip_private
+    return _filter_items_keep_private
+
+
 def filter_items(
         items: Iterator[Tuple[str, Any]],
         *,
         skip_private: bool,
 ) -> Iterator[Tuple[Hashable, Any]]:
-    for key, value in items:
-        skip = key.startswith('__')
-        skip = skip or (skip_private and key.startswith('_'))
-        skip = skip or litecore.utils.is_function(value)
-        if not skip:
-            yield key, value
+    return _items_filter(skip_private)(items)
 
 
 def _iter_mapping(obj: Any):
@@ -93,22 +234,20 @@ def _iter_collection(obj: Any):
 
 
 def _iter_namedtuple(obj: Any):
-    return obj._asdict().items()
+    return zip(obj._fields, obj)
 
 
 def _iter_dataclass(obj: Any):
-    return dataclasses.asdict(obj).items()
+    # Not dataclasses.asdict(), which deep copies the whole subtree (and
+    # turns nested dataclasses into dicts) before it is traversed again
+    return (
+        (field.name, getattr(obj, field.name))
+        for field in dataclasses.fields(obj)
+    )
 
 
 def _iter_class(obj: Any):
-    try:
-        slots_iter = (
-            (slot, getattr(obj, slot))
-            for slot in getattr(obj, '__slots__')
-        )
-    except AttributeError:
-        slots_iter = iter(())
-    return itertools.chain(vars(obj).items(), slots_iter)
+    return litecore.objtype.iter_attrs(obj)
 
 
 _ITERATORS = {
@@ -126,129 +265,130 @@ def classify(
         *,
         primitives: Optional[Tuple[Type, ...]] = None,
         skip_private: bool = True,
-) -> Tuple[Iterator[Any], ClassMarkerFlag]:
+) -> Tuple[ClassMarkerFlag, Iterator[Any]]:
     flag = ClassMarkerFlag.from_object(obj, primitives=primitives)
     iterate_items = _ITERATORS.get(flag, None)
     if iterate_items is None:
-        return iter(()), ClassMarkerFlag.NONE
-    items = (item for item in iterate_items(obj))
-    if flag & ClassMarkerFlag.HAS_ATTRIBUTES:
+        return ClassMarkerFlag.NONE, iter(())
+    items = iterate_items(obj)
+    if flag in _HAS_ATTRIBUTES:
         items = filter_items(items, skip_private=skip_private)
     return flag, items
 
 
 class ClassMarker(abc.ABC):
+    __slots__ = ('metadata',)
+    # Attributes shown in the repr after the metadata
+    _repr_fields: Tuple[str, ...] = ()
+
     def __init__(self, *, metadata: Mapping[str, Any], **kwargs):
         super().__init__(**kwargs)
         self.metadata = metadata
 
     def __repr__(self):
+        fields = ''.join(
+            f', {name}={getattr(self, name)!r}' for name in self._repr_fields)
         return (
             f'<{type(self).__name__}('
-            f'metadata={self.metadata!r}'
+            f'metadata={dict(self.metadata)!r}{fields}'
             f')>'
         )
 
+    def _key(self) -> Tuple:
+        return (self.metadata['module'], self.metadata['qualname'])
+
     def __eq__(self, other):
         if not isinstance(other, type(self)):
             return NotImplemented
-        return all(
-            self.metadata[key] == other.metadata[key]
-            for key in ('module', 'qualname')
-        )
+        return self._key() == other._key()
 
     @staticmethod
-    def make_metadata_from_object(obj: Any, **kwargs):
+    def make_metadata_from_object(obj: Any, **kwargs) -> Mapping[str, Any]:
+        # Markers for objects of the same type share one read-only mapping
         cls = type(obj)
-        metadata = {
-            'module': cls.__module__,
-            'qualname': cls.__qualname__,
-        }
-        metadata.update(**kwargs)
+        metadata = _METADATA_CACHE.get(cls)
+        if metadata is None:
+            metadata = _METADATA_CACHE[cls] = types.MappingProxyType({
+                'module': cls.__module__,
+                'qualname': cls.__qualname__,
+            })
+        if kwargs:
+            return {**metadata, **kwargs}
         return metadata
 
 
+# Weakly keyed, so that classes can still be garbage collected
+_METADATA_CACHE: MutableMapping[Type, Mapping[str, Any]] = (
+    weakref.WeakKeyDictionary())
+
+
 class SequenceItem(ClassMarker):
+    __slots__ = ('index',)
+    _repr_fields = ('index',)
+
     def __init__(self, *, index: int, **kwargs):
         super().__init__(**kwargs)
         self.index = index
 
-    def __repr__(self):
-        s = super().__repr__().replace(')>', '')
-        return f'{s}, index={self.index!r})>'
-
-    def __eq__(self, other):
-        eq = super().__eq__(other)
-        if eq is not True:
-            return eq
-        return self.index == other.index
+    def _key(self) -> Tuple:
+        return super()._key() + (self.index,)
 
 
 class SetItem(ClassMarker):
+    __slots__ = ('item',)
+    _repr_fields = ('item',)
+
     def __init__(self, *, item: Hashable, **kwargs):
         super().__init__(**kwargs)
         self.item = item
 
-    def __repr__(self):
-        s = super().__repr__().replace(')>', '')
-        return f'{s}, item={self.item!r})>'
-
-    def __eq__(self, other):
-        eq = super().__eq__(other)
-        if eq is not True:
-            return eq
-        return self.item == other.item
+    def _key(self) -> Tuple:
+        return super()._key() + (self.item,)
 
 
 class KeyMarker(ClassMarker):
+    __slots__ = ('key',)
+    _repr_fields = ('key',)
+
     def __init__(self, *, key: Hashable, **kwargs):
         super().__init__(**kwargs)
         self.key = key
 
-    def __repr__(self):
-        s = super().__repr__().replace(')>', '')
-        return f'{s}, key={self.key!r})>'
-
-    def __eq__(self, other):
-        eq = super().__eq__(other)
-        if eq is not True:
-            return eq
-        return self.key == other.key
+    def _key(self) -> Tuple:
+        return super()._key() + (self.key,)
 
 
 class MappingKey(KeyMarker):
-    pass
+    __slots__ = ()
 
 
 class AttributeMarker(ClassMarker):
+    __slots__ = ('attr',)
+    _repr_fields = ('attr',)
+
     def __init__(self, *, attr: Any, **kwargs):
         super().__init__(**kwargs)
         self.attr = attr
 
-    def __repr__(self):
-        s = super().__repr__().replace(')>', '')
-        return f'{s}, attr={self.attr!r})>'
-
-    def __eq__(self, other):
-        eq = super().__eq__(other)
-        if eq is not True:
-            return eq
-        return self.attr == other.attr
+    def _key(self) -> Tuple:
+        return super()._key() + (self.attr,)
 
 
 class ClassAttribute(AttributeMarker):
-    pass
+    __slots__ = ()
 
 
 class NamedTupleField(AttributeMarker):
-    pass
+    __slots__ = ()
 
 
 class DataClassField(AttributeMarker):
-    pass
+    __slots__ = ()
 
 
 class RecursiveMarker(ClassMarker):
+    __slots__ = ('obj_id', 'path')
+
     def __init__(
             self,
             *,
@@ -260,12 +400,12 @@ class RecursiveMarker(ClassMarker):
         self.obj_id = obj_id
         self.path = path
 
-    def __repr__(self):
-        s = super().__repr__().replace(')>', '')
+    @property
+    def _repr_fields(self) -> Tuple[str, ...]:
         if self.path is not None:
-            return f'{s}, obj_id={self.obj_id!r}, path={self.path!r})>'
+            return ('obj_id', 'path')
         else:
-            return f'{s}, obj_id={self.obj_id!r})>'
+            return ('obj_id',)
 
     def __eq__(self, other):
         eq = super().__eq__(other)
@@ -277,44 +417,44 @@ class RecursiveMarker(ClassMarker):
             return True
 
 
-def _class_attr_factory(obj, path_component, child):
+def _class_attr_factory(metadata, path_component):
     return ClassAttribute(
-        metadata=ClassMarker.make_metadata_from_object(obj),
+        metadata=metadata,
         attr=path_component,
     )
 
 
-def _namedtuple_field_factory(obj, path_component, child):
+def _namedtuple_field_factory(metadata, path_component):
     return NamedTupleField(
-        metadata=ClassMarker.make_metadata_from_object(obj),
+        metadata=metadata,
         attr=path_component,
     )
 
 
-def _dataclass_field_factory(obj, path_component, child):
+def _dataclass_field_factory(metadata, path_component):
     return DataClassField(
-        metadata=ClassMarker.make_metadata_from_object(obj),
+        metadata=metadata,
         attr=path_component,
     )
 
 
-def _mapping_key_factory(obj, path_component, child):
+def _mapping_key_factory(metadata, path_component):
     return MappingKey(
-        metadata=ClassMarker.make_metadata_from_object(obj),
+        metadata=metadata,
         key=path_component,
     )
 
 
-def _sequence_item_factory(obj, path_component, child):
+def _sequence_item_factory(metadata, path_component):
     return SequenceItem(
-        metadata=ClassMarker.make_metadata_from_object(obj),
+        metadata=metadata,
         index=path_component,
     )
 
 
-def _set_item_factory(obj, path_component, child):
+def _set_item_factory(metadata, path_component):
     return SetItem(
-        metadata=ClassMarker.make_metadata_from_object(obj),
+        metadata=metadata,
         item=path_component,
     )
 
@@ -332,12 +472,67 @@ _PATH_FACTORIES = {
 def _get_path_factory(
         flag: ClassMarkerFlag,
         class_markers: ClassMarkerFlag,
-) -> Callable:
-    if flag & class_markers:
-        factory = _PATH_FACTORIES.get(flag, None)
-    else:
-        factory = None
-    return factory
+        obj: Any,
+) -> Optional[Callable[[Hashable], ClassMarker]]:
+    # Markers for children of the same type share that type's metadata, so
+    # it is bound into the factory once rather than looked up per edge
+    if not flag & class_markers:
+        return None
+    factory = _PATH_FACTORIES.get(flag, None)
+    if factory is None:
+        return None
+    return functools.partial(
+        factory,
+        ClassMarker.make_metadata_from_object(obj),
+    )
+
+
+def _iter_filtered_items(
+        iterate_items: Callable[[Any], Iterator[Tuple[str, Any]]],
+        items_filter: Callable[
+            [Iterator[Tuple[str, Any]]], Iterator[Tuple[Hashable, Any]]],
+        obj: Any,
+) -> Iterator[Tuple[Hashable, Any]]:
+    return items_filter(iterate_items(obj))
+
+
+_Dispatch = Tuple[ClassMarkerFlag, Optional[Callable], Optional[Callable]]
+
+
+def _build_dispatcher(
+        primitives: Optional[Tuple[Type, ...]],
+        class_markers: ClassMarkerFlag,
+        skip_private: bool,
+) -> Callable[[Any], _Dispatch]:
+    """Return a function resolving (flag, item iterator, path factory).
+
+    The options are fixed for a whole traversal, so the result only depends
+    on the type of each object, and is memoized per type.
+
+    """
+    cache = {}
+    classifier = make_classifier(primitives)
+    items_filter = _items_filter(skip_private)
+
+    def dispatch(obj: Any) -> _Dispatch:
+        obj_type = type(obj)
+        entry = cache.get(obj_type)
+        if entry is None:
+            flag = classifier(obj)
+            iterate_items = _ITERATORS.get(flag, None)
+            if iterate_items is None:
+                flag = ClassMarkerFlag.NONE
+            elif flag in _HAS_ATTRIBUTES:
+                iterate_items = functools.partial(
+                    _iter_filtered_items,
+                    iterate_items,
+                    items_filter,
+                )
+            path_factory = _get_path_factory(flag, class_markers, obj)
+            entry = cache[obj_type] = (flag, iterate_items, path_factory)
+        return entry
+
+    return dispatch
 
 
 def _tupleize_keys(k1, k2) -> Tuple[Hashable, ...]:
@@ -356,55 +551,80 @@ def flatten(
         maxlevels: Optional[int] = None,
         skip_private: bool = True,
         class_markers: ClassMarkerFlag = ClassMarkerFlag.NONE,
-        _path=(),
-        _memo=None,
-        _level=None,
-):
-    if _memo is None:
-        _memo = dict()
-    if maxlevels is not None:
-        if _level is None:
-            _level = 0
-        elif _level > maxlevels:
-            yield obj
+) -> Iterator[Tuple[Hashable, Any]]:
+    """Generate (path, value) pairs for the leaves of a nested object.
+
+    Objects deeper than maxlevels (the top-level object is at level 0) are
+    treated as leaves. A container which contains itself is represented by
+    a RecursiveMarker.
+
+    Examples:
+
+    >>> list(flatten({'a': [1, 2], 'b': {'c': 3}}))
+    [(('a', 0), 1), (('a', 1), 2), (('b', 'c'), 3)]
+    >>> list(flatten({'a': [1, 2], 'b': {'c': 3}}, maxlevels=0))
+    [(('a',), [1, 2]), (('b',), {'c': 3})]
+    >>> items = [1]
+    >>> items.append(items)
+    >>> list(flatten(items))  # doctest: +ELLIPSIS
+    [((0,), 1), ((1,), <RecursiveMarker(..., obj_id=..., path=())>)]
+
+    """
+    # Iterative depth-first traversal: each stack entry holds a container
+    # being expanded, as (container id, path, level, items, path factory)
+    dispatch = _build_dispatcher(primitives, class_markers, skip_private)
+    # Ids of the containers on the stack; their paths are only looked up
+    # (from the stack itself) when a cycle is actually found
+    memo = set()
+    stack = []
+    push = stack.append
+    # Bind loop-invariant lookups to locals for the per-node loop
+    leaf_types = _LEAF_TYPES
+    no_flag = ClassMarkerFlag.NONE
+    no_value = _NO_VALUE
+    max_level = float('inf') if maxlevels is None else maxlevels
+    # The default reducer just appends to the tuple, so do that inline
+    inline_tuples = path_reducer is _tupleize_keys
+    node, path, level = obj, (), 0
+    while True:
+        # Plain leaves make up most nodes, so they bypass the dispatcher
+        if type(node) in leaf_types:
+            flag = no_flag
         else:
-            next_level = _level + 1
-    else:
-        next_level = None
-    flag, items = classify(
-        obj,
-        primitives=primitives,
-        skip_private=skip_private,
-    )
-    assert flag is not None
-    if flag is not ClassMarkerFlag.NONE:
-        path_factory = _get_path_factory(flag, class_markers)
-        if id(obj) not in _memo:
-            _memo[id(obj)] = _path
-            for path_component, child in items:
-                if path_factory is not None:
-                    path_component = path_factory(obj, path_component, child)
-                for item in flatten(
-                        child,
-                        path_reducer=path_reducer,
-                        primitives=primitives,
-                        maxlevels=maxlevels,
-                        skip_private=skip_private,
-                        class_markers=class_markers,
-                        _path=path_reducer(_path, path_component),
-                        _memo=_memo,
-                        _level=next_level,
-                ):
-                    yield item
-            del _memo[id(obj)]
+            flag, iterate_items, path_factory = dispatch(node)
+        if flag is no_flag or level > max_level:
+            yield path, node
         else:
-            yield _path, RecursiveMarker(
-                metadata=ClassMarker.make_metadata_from_object(obj),
-                obj_id=id(obj),
-                path=_memo[id(obj)],
-            )
-    else:
-        yield _path, obj
+            oid = id(node)
+            if oid in memo:
+                yield path, RecursiveMarker(
+                    metadata=ClassMarker.make_metadata_from_object(node),
+                    obj_id=oid,
+                    path=next(entry[1] for entry in stack if entry[0] == oid),
+                )
+            else:
+                memo.add(oid)
+                items = iter(iterate_items(node))
+                push((oid, path, level, items, path_factory))
+        # Advance to the next child of the innermost unfinished container
+        while stack:
+            oid, parent_path, parent_level, items, path_factory = stack[-1]
+            item = next(items, no_value)
+            if item is no_value:
+                stack.pop()
+                memo.discard(oid)
+                continue
+            path_component, node = item
+            if path_factory is not None:
+                path_component = path_factory(path_component)
+            if inline_tuples:
+                path = parent_path + (path_component,)
+            else:
+                path = path_reducer(parent_path, path_component)
+            level = parent_level + 1
+            break
+        else:
+            return
 
 
 def recursive_equality(
@@ -427,11 +647,7 @@ def recursive_equality(
         primitives=primitives,
         skip_private=skip_private,
     )
-    return all(x == y for x, y in itertools.zip_longest(
-        one_items,
-        other_items,
-        fillvalue=_NO_VALUE,
-    ))
+    return litecore.objtype.flattened_equal(one_items, other_items)
 
 
 def serialize(
@@ -440,51 +656,73 @@ def serialize(
         metadata_key: Optional[str] = None,
         primitives: Optional[Tuple[Type]] = None,
         skip_private: bool = True,
-        _memo=None,
 ) -> Union[List[Any], Dict[Hashable, Any]]:
-    if _memo is None:
-        _memo = set()
-    if id(obj) not in _memo:
-        flag, items = classify(
-            obj,
-            primitives=primitives,
-            skip_private=skip_private,
-        )
-        assert flag is not None
-        if flag & ClassMarkerFlag.SERIALIZED_AS_LIST:
-            _memo.add(id(obj))
-            result = [
-                serialize(
-                    item,
-                    metadata_key=metadata_key,
-                    primitives=primitives,
-                    skip_private=skip_private,
-                    _memo=_memo,
-                ) for index, item in items
-            ]
-            _memo.remove(id(obj))
-        elif flag & ClassMarkerFlag.SERIALIZED_AS_DICT:
-            _memo.add(id(obj))
-            result = {
-                key: serialize(
-                    value,
-                    metadata_key=metadata_key,
-                    primitives=primitives,
-                    skip_private=skip_private,
-                    _memo=_memo,
-                ) for key, value in items
-            }
-            _memo.remove(id(obj))
-            if flag.is_class and metadata_key is not None:
-                result[metadata_key] = ClassMarker.make_metadata_from_object(obj)
+    """Convert a nested object into nested lists and dicts.
+
+    Examples:
+
+    >>> serialize({'a': (1, {2}), 'b': {'c': 3}})
+    {'a': [1, [2]], 'b': {'c': 3}}
+    >>> deep = []
+    >>> node = deep
+    >>> for _ in range(5000):
+    ...     node.append([])
+    ...     node = node[0]
+    >>> result = serialize(deep)
+    >>> for _ in range(5000):
+    ...     result = result[0]
+    >>> result
+    []
+
+    """
+    # Iterative depth-first traversal: each stack entry holds a container
+    # being serialized, as (container, id, flag, result, items, key in parent)
+    dispatch = _build_dispatcher(primitives, ClassMarkerFlag.NONE, skip_private)
+    memo = set()
+    stack = []
+    push = stack.append
+    node, key = obj, None
+    while True:
+        flag, iterate_items, _ = dispatch(node)
+        oid = id(node)
+        expanded = False
+        if oid in memo:
+            value = RecursiveMarker(
+                metadata=ClassMarker.make_metadata_from_object(node),
+                obj_id=oid,
+            )
+        elif flag in _AS_LIST:
+            memo.add(oid)
+            # Items come with their positions, so fill in a presized list
+            result = [None] * len(node)
+            push((node, oid, flag, result, iter(iterate_items(node)), key))
+            expanded = True
+        elif flag in _AS_DICT:
+            memo.add(oid)
+            push((node, oid, flag, {}, iter(iterate_items(node)), key))
+            expanded = True
         else:
-            result = obj
-    else:
-        result = RecursiveMarker(
-            metadata=ClassMarker.make_metadata_from_object(obj),
-            obj_id=id(obj),
-        )
-    return result
+            value = node
+        if not expanded:
+            if not stack:
+                return value
+            stack[-1][3][key] = value
+        # Advance to the next child of the innermost unfinished container,
+        # storing the results of the containers which are finished
+        while True:
+            parent, oid, parent_flag, result, items, parent_key = stack[-1]
+            item = next(items, _NO_VALUE)
+            if item is not _NO_VALUE:
+                key, node = item
+                break
+            stack.pop()
+            memo.discard(oid)
+            if parent_flag in _HAS_ATTRIBUTES and metadata_key is not None:
+                result[metadata_key] = dict(
+                    ClassMarker.make_metadata_from_object(parent))
+            if not stack:
+                return result
+            stack[-1][3][parent_key] = result
 
 
 # def modify(
@@ -1,5 +1,3 @@
-import itertools
-
 from typing import (
     Any,
     Hashable,
@@ -40,9 +38,6 @@ def flatten(
         *,
         maxdepth: Optional[int] = None,
         child_object_getter: lcot.ChildObjectGetter = lcot.child_objects,
-        _depth=None,
-        _seen=None,
-        _path=None,
 ):
     """
 
@@ -58,33 +53,50 @@ def flatten(
     >>> items = [items]
     >>> items.append(items)
     >>> list(flatten(items))  # doctest: +ELLIPSIS
-
+    [((0, 'a', 0), 1), ..., ((1,), <RecursiveMarker: <class 'list'> with id ...>)]
+    >>> deep = []
+    >>> node = deep
+    >>> for _ in range(5000):
+    ...     node.append([])
+    ...     node = node[0]
+    >>> node.append('leaf')
+    >>> [(len(path), value) for path, value in flatten(deep)]
+    [(5001, 'leaf')]
 
     """
-    if _depth is None:
-        _depth = 0
-    if _seen is None:
-        _seen = {}
-    if _path is None:
-        _path = ()
-    children = child_object_getter(obj)
-    deeper = maxdepth is None or _depth < maxdepth
-    if children is None or not deeper:
-        yield _path, obj
-    elif id(obj) in _seen:
-        yield _path, RecursiveMarker(obj, _path)
-    else:
-        _seen[id(obj)] = _path
-        for path_component, child in children:
-            yield from flatten(
-                child,
-                maxdepth=maxdepth,
-                child_object_getter=child_object_getter,
-                _depth=_depth + 1,
-                _seen=_seen,
-                _path=_path + (path_component,),
-            )
-        del _seen[id(obj)]
+    # Iterative depth-first traversal: each stack entry holds a container
+    # being expanded, as (container id, path, depth, children). Leaves are
+    # yielded directly from the loop, rather than through a chain of
+    # nested generators as deep as the object.
+    seen = set()
+    stack = []
+    push = stack.append
+    node, path, depth = obj, (), 0
+    while True:
+        children = child_object_getter(node)
+        if children is None or (maxdepth is not None and depth >= maxdepth):
+            yield path, node
+        else:
+            oid = id(node)
+            if oid in seen:
+                yield path, RecursiveMarker(node, path)
+            else:
+                seen.add(oid)
+                push((oid, path, depth, iter(children)))
+        # Advance to the next child of the innermost unfinished container
+        while stack:
+            oid, parent_path, parent_depth, items = stack[-1]
+            item = next(items, _NO_VALUE)
+            if item is _NO_VALUE:
+                stack.pop()
+                seen.discard(oid)
+                continue
+            path_component, node = item
+            path = parent_path + (path_component,)
+            depth = parent_depth + 1
+            break
+        else:
+            return
 
 
 def deep_equality(
@@ -97,11 +109,7 @@ def deep_equality(
     second_items = flatten(
         second,
     )
-    return all(x == y for x, y in itertools.zip_longest(
-        first_items,
-        second_items,
-        fillvalue=_NO_VALUE,
-    ))
+    return lcot.flattened_equal(first_items, second_items)
 
 
 # def serialize(
@@ -1,21 +1,26 @@
+import abc
 import collections.abc
 import dataclasses
 import functools
 import inspect
 import itertools
 import types
+import weakref
 
 from typing import (
     Any,
     Callable,
     Hashable,
     Iterator,
+    MutableMapping,
     Optional,
     Tuple,
     Type,
     Union,
 )
 
+from litecore.sentinels import NO_VALUE as _NO_VALUE
+
 
 def are_all(obj_type, *args) -> bool:
     return all(isinstance(arg, obj_type) for arg in args)
@@ -136,8 +141,25 @@ def is_iterator(obj: Any) -> bool:
             return False
 
 
-def is_namedtuple_instance(obj: Any) -> bool:
-    cls = type(obj)
+def _cached_per_type(func: Callable[[Type], Any]) -> Callable[[Type], Any]:
+    # Like functools.lru_cache, but weakly keyed, so that classes can still
+    # be garbage collected
+    cache = weakref.WeakKeyDictionary()
+
+    @functools.wraps(func)
+    def wrapper(cls: Type) -> Any:
+        try:
+            return cache[cls]
+        except KeyError:
+            pass
+        result = cache[cls] = func(cls)
+        return result
+
+    return wrapper
+
+
+@_cached_per_type
+def _is_namedtuple_type(cls: Type) -> bool:
     bases = cls.__bases__
     if len(bases) != 1 or bases[0] is not tuple:
         return False
@@ -147,31 +169,126 @@ def is_namedtuple_instance(obj: Any) -> bool:
     return all(type(field) is str for field in fields)
 
 
+def is_namedtuple_instance(obj: Any) -> bool:
+    """Check if an object is an instance of a namedtuple class.
+
+    Examples:
+
+    >>> import collections
+    >>> Point = collections.namedtuple('Point', 'x y')
+    >>> is_namedtuple_instance(Point(1, 2))
+    True
+    >>> is_namedtuple_instance((1, 2))
+    False
+    >>> is_namedtuple_instance(Point)
+    False
+
+    """
+    return _is_namedtuple_type(type(obj))
+
+
+@_cached_per_type
+def _is_dataclass_type(cls: Type) -> bool:
+    # Instances of metaclasses are classes, never dataclass instances
+    return dataclasses.is_dataclass(cls) and not issubclass(cls, type)
+
+
 def is_dataclass_instance(obj: Any) -> bool:
-    return dataclasses.is_dataclass(obj) and not isinstance(obj, type)
+    """Check if an object is an instance of a dataclass.
+
+    Examples:
+
+    >>> @dataclasses.dataclass
+    ... class Point:
+    ...     x: int
+    >>> is_dataclass_instance(Point(1))
+    True
+    >>> is_dataclass_instance(Point)
+    False
+
+    """
+    return _is_dataclass_type(type(obj))
+
+
+# types.LambdaType is types.FunctionType
+_FUNCTION_TYPES = frozenset({
+    types.BuiltinFunctionType,
+    types.FunctionType,
+    types.MethodType,
+    functools.partial,
+})
+_FUNCTION_BASES = tuple(_FUNCTION_TYPES)
 
 
 def is_function(obj: Any) -> bool:
-    if not callable(obj):
-        return False
-    return isinstance(obj, (
-        types.BuiltinFunctionType,
-        types.FunctionType,
-        types.MethodType,
-        types.LambdaType,
-        functools.partial,
-    ))
+    """Check if an object is a function, method or partial.
 
+    Examples:
 
-def iter_attrs(obj: Any) -> Iterator[Tuple[str, Any]]:
+    >>> is_function(len)
+    True
+    >>> is_function(lambda x: x)
+    True
+    >>> class MyPartial(functools.partial):
+    ...     pass
+    >>> is_function(MyPartial(len))
+    True
+    >>> is_function(int)
+    False
+
+    """
+    if type(obj) in _FUNCTION_TYPES:
+        return True
+    # Only subclasses (e.g., of functools.partial) need the isinstance check
+    return callable(obj) and isinstance(obj, _FUNCTION_BASES)
+
+
+# Weakly keyed, so that classes can still be garbage collected
+_SLOT_NAMES: MutableMapping[Type, Tuple[str, ...]] = weakref.WeakKeyDictionary()
+
+
+def slot_names(cls: Type) -> Tuple[str, ...]:
+    """Return the names of all slots declared by a class and its bases.
+
+    The names are cached per class, as an immutable tuple.
+
+    Examples:
+
+    >>> class A:
+    ...     __slots__ = ('a', 'b')
+    >>> class B(A):
+    ...     __slots__ = 'c'
+    >>> slot_names(B)
+    ('c', 'a', 'b')
+    >>> slot_names(int)
+    ()
+
+    """
     try:
-        slots_iter = (
-            (slot, getattr(obj, slot))
-            for slot in getattr(obj, '__slots__')
-        )
-    except AttributeError:
-        slots_iter = iter(())
-    return itertools.chain(vars(obj).items(), slots_iter)
+        return _SLOT_NAMES[cls]
+    except KeyError:
+        pass
+    names = []
+    for klass in cls.__mro__:
+        slots = vars(klass).get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(slots)
+    result = _SLOT_NAMES[cls] = tuple(names)
+    return result
+
+
+def iter_attrs(obj: Any) -> Iterator[Tuple[str, Any]]:
+    owner = obj if isinstance(obj, type) else type(obj)
+    slots_iter = (
+        (slot, getattr(obj, slot))
+        for slot in slot_names(owner)
+        if hasattr(obj, slot)
+    )
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is None:
+        return slots_iter
+    return itertools.chain(attrs.items(), slots_iter)
 
 
 def filter_attributes(
@@ -195,29 +312,126 @@ ObjectGetterReturnType = Union[None, Iterator[Tuple[Union[int, Hashable], Any]]]
 ChildObjectGetter = Callable[[Any], ObjectGetterReturnType]
 
 
-def child_objects(
-        obj: Any,
-        *,
-        exclude_types: Optional[Tuple[Type, ...]] = None,
-        class_attr_filter: Optional[Callable[..., bool]] = filter_attributes,
-) -> ObjectGetterReturnType:
-    if exclude_types is not None and isinstance(obj, exclude_types):
-        return
-    elif is_chars(obj):
-        return
+def _iter_dataclass_fields(obj: Any) -> Iterator[Tuple[str, Any]]:
+    return (
+        (field.name, getattr(obj, field.name))
+        for field in dataclasses.fields(obj)
+    )
+
+
+def _iter_namedtuple_fields(obj: Any) -> Iterator[Tuple[str, Any]]:
+    return zip(obj._fields, obj)
+
+
+def _iter_mapping_items(obj: Any) -> Iterator[Tuple[Hashable, Any]]:
+    return obj.items()
+
+
+# Per type: the function returning the children, and whether those are
+# attributes (subject to the attribute filter); None for leaf objects
+_ChildDispatch = Optional[Tuple[Callable[[Any], Iterator], bool]]
+# Weakly keyed, so that classes can still be garbage collected, and cleared
+# whenever a class is registered with an ABC (as functools.singledispatch
+# does), since that can change which children a type has
+_CHILD_DISPATCH: MutableMapping[Type, _ChildDispatch] = weakref.WeakKeyDictionary()
+_child_dispatch_token = None
+# Built-in types which never have children, checked before anything else
+_LEAF_TYPES = frozenset({
+    int, float, complex, bool, str, bytes, bytearray, type(None),
+})
+
+
+def _child_dispatch(obj: Any) -> _ChildDispatch:
+    if is_chars(obj):
+        return None
     elif is_dataclass_instance(obj):
-        iterator = dataclasses.asdict(obj).items()
+        return _iter_dataclass_fields, True
     elif is_namedtuple_instance(obj):
-        iterator = obj._asdict().items()
+        return _iter_namedtuple_fields, True
     elif isinstance(obj, collections.abc.Mapping):
-        return obj.items()
+        return _iter_mapping_items, False
     elif is_iterable(obj):
-        return enumerate(obj)
+        return enumerate, False
     elif inspect.isclass(obj):
-        iterator = iter_attrs(obj)
+        return iter_attrs, True
     else:
-        return
-    if class_attr_filter is not None:
-        return filter(class_attr_filter, iterator)
-    else:
-        return iterator
+        return None
+
+
+def _cached_child_dispatch(obj: Any) -> _ChildDispatch:
+    global _child_dispatch_token
+    token = abc.get_cache_token()
+    if token != _child_dispatch_token:
+        _CHILD_DISPATCH.clear()
+        _child_dispatch_token = token
+    obj_type = type(obj)
+    try:
+        return _CHILD_DISPATCH[obj_type]
+    except KeyError:
+        pass
+    dispatch = _CHILD_DISPATCH[obj_type] = _child_dispatch(obj)
+    return dispatch
+
+
+def child_objects(
+        obj: Any,
+        *,
+        exclude_types: Optional[Tuple[Type, ...]] = None,
+        class_attr_filter: Optional[Callable[..., bool]] = filter_attributes,
+) -> ObjectGetterReturnType:
+    """Return an iterator of (key, child) pairs, or None for a leaf object.
+
+    Examples:
+
+    >>> list(child_objects({'a': 1}))
+    [('a', 1)]
+    >>> child_objects('abc') is None
+    True
+    >>> list(child_objects([3, 4]))
+    [(0, 3), (1, 4)]
+    >>> child_objects([3, 4], exclude_types=(list,)) is None
+    True
+
+    """
+    if type(obj) in _LEAF_TYPES:
+        return None
+    elif exclude_types is not None and isinstance(obj, exclude_types):
+        return None
+    # The kind of children only depends on the type of the object, so the
+    # checks run once per type rather than once per object
+    dispatch = _cached_child_dispatch(obj)
+    if dispatch is None:
+        return None
+    iterate, has_attributes = dispatch
+    children = iterate(obj)
+    if has_attributes and class_attr_filter is not None:
+        return filter(class_attr_filter, children)
+    return children
+
+
+def flattened_equal(
+        one_items: Iterator[Tuple[Hashable, Any]],
+        other_items: Iterator[Tuple[Hashable, Any]],
+) -> bool:
+    """Compare two flattened traversals item by item.
+
+    Stops at the first difference, and closes both generators right away
+    rather than leaving their traversal state for the garbage collector.
+
+    Examples:
+
+    >>> flattened_equal((x for x in [1, 2]), (x for x in [1, 2]))
+    True
+    >>> flattened_equal((x for x in [1, 2]), (x for x in [1]))
+    False
+
+    """
+    try:
+        for item in one_items:
+            other_item = next(other_items, _NO_VALUE)
+            if other_item is _NO_VALUE or item != other_item:
+                return False
+        return next(other_items, _NO_VALUE) is _NO_VALUE
+    finally:
+        one_items.close()
+        other_items.close()
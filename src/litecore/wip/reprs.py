@@ -7,18 +7,6 @@ from typing import (
 )
 
 
-def _arg_repr(arg_seq: Optional[Sequence] = None) -> str:
-    if arg_seq is None:
-        return ''
-    return ', '.join(f'{v!r}' for v in arg_seq)
-
-
-def _kwarg_repr(kwarg_dict: Optional[Mapping] = None) -> str:
-    if kwarg_dict is None:
-        return ''
-    return ', '.join(f'{k}={v!r}' for k, v in sorted(kwarg_dict.items()))
-
-
 def simple_repr(
         obj: Any,
         *,
@@ -29,11 +17,31 @@ def simple_repr(
 ) -> str:
     """Meaningful simple repr() for custom classes.
 
+    Attributes named in kwargs are shown in the order given, while the
+    items of an explicit kwarg_dict are sorted by name.
+
+    Examples:
+
+    >>> class Point:
+    ...     def __init__(self, x, y, label=None):
+    ...         self.x, self.y, self.label = x, y, label
+    >>> p = Point(1, 2, label='origin')
+    >>> simple_repr(p, args=('x', 'y'), kwargs=('label',))
+    "Point(1, 2, label='origin')"
+    >>> simple_repr(p, kwargs=('y', 'x'))
+    'Point(y=2, x=1)'
+    >>> simple_repr(p, kwarg_dict={'y': 2, 'x': 1})
+    'Point(x=1, y=2)'
+
     """
-    sep = ',' if (args and kwargs) else ''
-    full_name = type(obj).__qualname__
     if arg_seq is None and args is not None:
         arg_seq = [getattr(obj, arg) for arg in args]
-    if kwarg_dict is None and kwargs is not None:
-        kwarg_dict = {kwarg: getattr(obj, kwarg) for kwarg in kwargs}
-    return f'{full_name}({_arg_repr(arg_seq)}{sep}{_kwarg_repr(kwarg_dict)})'
+    if kwarg_dict is not None:
+        kwarg_items = sorted(kwarg_dict.items())
+    elif kwargs is not None:
+        kwarg_items = [(kwarg, getattr(obj, kwarg)) for kwarg in kwargs]
+    else:
+        kwarg_items = ()
+    parts = [f'{v!r}' for v in arg_seq] if arg_seq is not None else []
+    parts.extend(f'{k}={v!r}' for k, v in kwarg_items)
+    return f'{type(obj).__qualname__}({", ".join(parts)})'
@@ -9,24 +9,86 @@ from typing import (
     Any,
     Callable,
     Iterable,
+    Iterator,
     List,
     NoReturn,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
 from litecore import LitecoreError
-import litecore.nested
 
 log = logging.getLogger(__name__)
 
 
+_CONTAINER_TYPES = (list, tuple, dict)
+# Stands in for the items past the end of the shorter of two sequences,
+# and is never compared with ==
+_MISSING = object()
+
+
 def recursion_safe_list_equality(one: List[Any], other: List[Any]) -> bool:
-    try:
-        return one == other
-    except RecursionError:
-        return litecore.nested.recursive_equality(one, other)
+    """Compare two lists, however deeply nested or self-referential.
+
+    Nested lists, tuples and dicts are compared using an explicit stack
+    rather than recursive calls, and a pair of containers already being
+    compared is assumed to be equal when met again.
+
+    Examples:
+
+    >>> one = [1, [2, {'a': (3,)}]]
+    >>> recursion_safe_list_equality(one, [1, [2, {'a': (3,)}]])
+    True
+    >>> recursion_safe_list_equality(one, [1, [2, {'a': [3]}]])
+    False
+    >>> one.append(one)
+    >>> other = [1, [2, {'a': (3,)}]]
+    >>> other.append(other)
+    >>> recursion_safe_list_equality(one, other)
+    True
+
+    """
+    return _all_pairs_equal(iter([(one, other)]))
+
+
+def _all_pairs_equal(pairs: Iterator[Tuple[Any, Any]]) -> bool:
+    # Pairs are pulled one at a time, so a lazy source of pairs is only
+    # consumed up to the first difference
+    stack = []
+    seen = set()
+    for pair in pairs:
+        # One sequence ran out first: checked by identity, since an item
+        # might compare equal to anything
+        if pair[0] is _MISSING or pair[1] is _MISSING:
+            return False
+        stack.append(pair)
+        while stack:
+            x, y = stack.pop()
+            if x is y:
+                continue
+            if isinstance(x, _LIST_WRAPPERS) and isinstance(y, _LIST_WRAPPERS):
+                # Compare the backing lists here, rather than through __eq__
+                x, y = x._as_list(), y._as_list()
+            x_type = type(x)
+            if x_type is not type(y) or x_type not in _CONTAINER_TYPES:
+                if x == y:
+                    continue
+                return False
+            ids = (id(x), id(y))
+            if ids in seen:
+                continue
+            seen.add(ids)
+            if len(x) != len(y):
+                return False
+            if x_type is dict:
+                if x.keys() != y.keys():
+                    return False
+                stack.extend((value, y[key]) for key, value in x.items())
+            else:
+                stack.extend(zip(x, y))
+    return True
 
 
 class SequenceProxyType(collections.abc.Sequence):
@@ -58,6 +120,8 @@ class SequenceProxyType(collections.abc.Sequence):
 
     def __init__(self, sequence: Sequence):
         self._sequence = sequence
+        # Bound once, so indexing does not look up the method every time
+        self._getitem = sequence.__getitem__
 
     def __repr__(self):
         return f'{type(self).__name__}({self._sequence!r})'
@@ -66,7 +130,7 @@ class SequenceProxyType(collections.abc.Sequence):
         return str(self._sequence)
 
     def __getitem__(self, index_or_slice: Union[int, slice]):
-        return self._sequence[index_or_slice]
+        return self._getitem(index_or_slice)
 
     def __len__(self):
         return len(self._sequence)
@@ -193,6 +257,9 @@ class BoundedList(collections.abc.MutableSequence):
     def __delitem__(self, index_or_slice: Union[int, slice]):
         del self.data[index_or_slice]
 
+    def _as_list(self) -> List[Any]:
+        return self.data
+
     def __eq__(self, other):
         if not isinstance(other, collections.abc.Sequence):
             return NotImplemented
@@ -228,6 +295,17 @@ class BoundedList(collections.abc.MutableSequence):
             assert take == 0
             if not suppress_raise:
                 self._raise_at_bound()
+        if iterable is self:
+            iterable = list(self.data)
+        if isinstance(iterable, collections.abc.Sized):
+            # The length is known up front, so no probing past the bound
+            if len(iterable) <= take:
+                self.data.extend(iterable)
+            else:
+                self.data.extend(itertools.islice(iterable, take))
+                if not suppress_raise:
+                    self._raise_would_exceed_bound()
+            return
         it = iter(iterable)
         self.data.extend(itertools.islice(it, take))
         try:
@@ -258,6 +336,30 @@ class BoundedList(collections.abc.MutableSequence):
 
 
 class LazyList(collections.abc.MutableSequence):
+    """
+
+    Examples:
+
+    >>> lazy = LazyList(iter(range(5)))
+    >>> [value for value in lazy if value < 3]
+    [0, 1, 2]
+    >>> lazy.consumed
+    True
+    >>> lazy == [0, 1, 2, 3, 4]
+    True
+    >>> lazy == LazyList(range(5))
+    True
+    >>> LazyList(itertools.count()) == [0, 1, 5]
+    False
+    >>> class Anything:
+    ...     def __eq__(self, other):
+    ...         return True
+    >>> LazyList([1, 2]) == [1, 2, Anything()]
+    False
+
+    """
+    sequence_factory = list
+
     def __init__(
             self,
             iterable: Iterable[Any] = (),
@@ -285,10 +387,13 @@ class LazyList(collections.abc.MutableSequence):
         return len(self._cache)
 
     def __iter__(self):
-        yield from self._cache
+        cache = self._cache
+        yield from cache
+        save = cache.append
         for value in self._lazy:
-            self._cache.append(value)
+            save(value)
             yield value
+        self.consumed = True
 
     def __bool__(self):
         if self._cache:
@@ -303,18 +408,19 @@ class LazyList(collections.abc.MutableSequence):
     def __eq__(self, other):
         if not isinstance(other, collections.abc.Sequence):
             return NotImplemented
-        if len(self) != len(other):
-            return False
-        if isinstance(other, LazyList):
-            other_data = other._cache
-        else:
-            other_data == list(other)
-        return recursion_safe_list_equality(self._cache, other_data)
+        # Compare in lockstep, so that neither side is consumed past the
+        # first difference (a missing item never equals an actual one)
+        pairs = itertools.zip_longest(self, other, fillvalue=_MISSING)
+        return _all_pairs_equal(pairs)
 
     def _consume_all(self) -> None:
         self._cache.extend(self._lazy)
         self.consumed = True
 
+    def _as_list(self) -> List[Any]:
+        self._consume_all()
+        return self._cache
+
     def _consume_next(self) -> None:
         try:
             self._cache.append(next(self._lazy))
@@ -443,6 +549,10 @@ class LazyList(collections.abc.MutableSequence):
         return new
 
 
+# Sequences compared by recursion_safe_list_equality() via their lists
+_LIST_WRAPPERS = (BoundedList, LazyList)
+
+
 class RecursiveLazyList(LazyList):
     @abc.abstractmethod
     def _producer(self):
@@ -1,5 +1,6 @@
 import bisect
 import collections
+import heapq
 import itertools
 import operator
 
@@ -13,6 +14,36 @@ from typing import (
     Union,
 )
 
+# Module-level aliases skip the bisect attribute lookup on every query
+_bisect_left = bisect.bisect_left
+_bisect_right = bisect.bisect_right
+_first = operator.itemgetter(0)
+# Number of key positions each SortedList remembers for repeated queries
+_BRACKET_CACHE_SIZE = 16
+
+
+def _merge_sorted(
+        keys: List[Any],
+        values: List[Any],
+        other_keys: List[Any],
+        other_values: List[Any],
+) -> Tuple[List[Any], List[Any]]:
+    # Linear merge of two key-sorted runs; on equal keys, the first run's
+    # items come first (just like insert_right())
+    merged = list(heapq.merge(
+        zip(keys, values),
+        zip(other_keys, other_values),
+        key=_first,
+    ))
+    return [k for k, v in merged], [v for k, v in merged]
+
+
+def _repeat_each(items: List[Any], n: int) -> List[Any]:
+    # [a, b] -> [a, a, b, b] for n == 2, without a Python-level loop and
+    # with only one repeat iterator alive at a time, whatever n is
+    return list(itertools.chain.from_iterable(
+        map(itertools.repeat, items, itertools.repeat(n, len(items)))))
+
 
 class SortedList(collections.abc.MutableSequence):
     @staticmethod
@@ -27,19 +58,28 @@ class SortedList(collections.abc.MutableSequence):
     ) -> None:
         self._keys = []
         self._values = []
+        # Recently computed (left, right) positions of keys; cleared by
+        # every change to the keys
+        self._brackets = collections.OrderedDict()
         self._key_arg = key
         if key is None:
             key = self.default_key
         self._update(iterable, key=key)
 
     def _update(self, iterable: Iterable[Any], *, key: Callable) -> None:
-        if iterable:
-            keyed = sorted(
-                ((key(item), i, item) for i, item in enumerate(iterable)),
-                key=operator.itemgetter(0),
-            )
-            self._keys = [k for k, i, v in keyed]
-            self._values = [v for k, i, v in keyed]
+        self._brackets.clear()
+        if iterable and key is self.default_key:
+            # Items are their own keys, so sort them directly without a key
+            # function (the sort is stable, just like the general case)
+            self._values = sorted(iterable)
+            self._keys = list(self._values)
+        elif iterable:
+            # Sort positions by key rather than (key, index, item) triples
+            values = list(iterable)
+            keys = list(map(key, values))
+            order = sorted(range(len(values)), key=keys.__getitem__)
+            self._keys = [keys[i] for i in order]
+            self._values = [values[i] for i in order]
         else:
             self._keys.clear()
             self._values.clear()
@@ -63,14 +103,31 @@ class SortedList(collections.abc.MutableSequence):
         return f'{type(self).__name__}({self._values!r}, key={self.key!r})'
 
     def _bracket(self, item: Any) -> Tuple[int, int]:
-        key = self.key(item)
-        left = bisect.bisect_left(self._keys, key)
-        right = bisect.bisect_right(self._keys, key)
-        return left, right
+        keys = self._keys
+        key = self._key_used(item)
+        brackets = self._brackets
+        try:
+            bracket = brackets.get(key)
+        except TypeError:
+            # Unhashable keys are never cached
+            return _bisect_left(keys, key), _bisect_right(keys, key)
+        if bracket is not None:
+            brackets.move_to_end(key)
+            return bracket
+        bracket = brackets[key] = (
+            _bisect_left(keys, key), _bisect_right(keys, key))
+        if len(brackets) > _BRACKET_CACHE_SIZE:
+            brackets.popitem(last=False)
+        return bracket
 
     def __contains__(self, item: Any) -> bool:
+        # Search the values with equal keys in place, rather than a copy
         left, right = self._bracket(item)
-        return item in self._values[left:right]
+        try:
+            self._values.index(item, left, right)
+        except ValueError:
+            return False
+        return True
 
     def __len__(self) -> int:
         return len(self._values)
@@ -107,11 +164,14 @@ class SortedList(collections.abc.MutableSequence):
         raise NotImplementedError(msg)
 
     def __add__(self, other):
-        if isinstance(other, SortedList):
-            values = self._values
-            values.extend(other._values)
+        if isinstance(other, SortedList) and other.key is self.key:
+            # Both are already sorted by the same key, so just merge them
+            new = type(self)(key=self.key)
+            new._keys, new._values = _merge_sorted(
+                self._keys, self._values, other._keys, other._values)
+            return new
         elif isinstance(other, collections.abc.Sequence):
-            values = self._values
+            values = list(self._values)
             values.extend(other)
         else:
             return NotImplemented
@@ -123,23 +183,25 @@ class SortedList(collections.abc.MutableSequence):
         self.extend(other)
         return self
 
-    def _mul_values(self, n: int) -> Iterator[Any]:
-        repeated = (itertools.repeat(item, n) for item in self._values)
-        return itertools.chain.from_iterable(repeated)
-
     def __mul__(self, n: int):
-        return type(self)(self._mul_values(n), key=self.key)
+        # Repeating each item in place keeps the lists sorted, so neither
+        # the keys nor the sort need to be computed again
+        new = type(self)(key=self.key)
+        new._keys = _repeat_each(self._keys, n)
+        new._values = _repeat_each(self._values, n)
+        return new
 
     __rmul__ = __mul__
 
     def __imul__(self, n: int):
-        values = list(self._mul_values(n))
-        self.clear()
-        self._update(values, key=self.key)
+        self._brackets.clear()
+        self._keys = _repeat_each(self._keys, n)
+        self._values = _repeat_each(self._values, n)
         return self
 
     def __delitem__(self, index_or_slice: Union[int, slice]) -> None:
         # TODO: transaction logic
+        self._brackets.clear()
         del self._keys[index_or_slice]
         del self._values[index_or_slice]
 
@@ -159,18 +221,27 @@ class SortedList(collections.abc.MutableSequence):
         return self._values.index(item, left, right)
 
     def find(self, key):
-        left = bisect.bisect_left(self._keys, key)
-        if left != len(self) and self._keys[left] == key:
+        keys = self._keys
+        left = _bisect_left(keys, key)
+        if left != len(keys) and keys[left] == key:
             return self._values[left]
         msg = f'no item found with key {key!r}'
         raise ValueError(msg)
 
     def count(self, item: Any) -> int:
         left, right = self._bracket(item)
-        return self._values[left:right].count(item)
+        values = self._values
+        count = 0
+        while True:
+            try:
+                left = values.index(item, left, right) + 1
+            except ValueError:
+                return count
+            count += 1
 
     def remove(self, item) -> None:
         i = self.index(item)
+        self._brackets.clear()
         del self._keys[i]
         del self._values[i]
 
@@ -178,14 +249,16 @@ class SortedList(collections.abc.MutableSequence):
         self._update((), key=self.key)
 
     def insert(self, item: Any) -> None:
-        key = self.key(item)
-        left = bisect.bisect_left(self._keys, key)
+        key = self._key_used(item)
+        left = _bisect_left(self._keys, key)
+        self._brackets.clear()
         self._keys.insert(left, key)
         self._values.insert(left, item)
 
     def insert_right(self, item: Any) -> None:
-        key = self.key(item)
-        right = bisect.bisect_right(self._keys, key)
+        key = self._key_used(item)
+        right = _bisect_right(self._keys, key)
+        self._brackets.clear()
         self._keys.insert(right, key)
         self._values.insert(right, item)
 
@@ -194,36 +267,52 @@ class SortedList(collections.abc.MutableSequence):
         raise NotImplementedError(msg)
 
     def extend(self, iterable: Iterable[Any]) -> None:
-        items = sorted(iterable, key=self.key)
-        for item in items:
-            self.insert_right(item)
+        key = self.key
+        if isinstance(iterable, SortedList) and iterable.key is key:
+            keys, items = list(iterable._keys), list(iterable._values)
+        else:
+            items = sorted(iterable, key=key)
+            keys = None
+        if len(items) * 8 < len(self._values):
+            # A few inserts (each one shifting the lists) are cheaper
+            for item in items:
+                self.insert_right(item)
+            return
+        # Otherwise merge the two sorted runs in a single pass
+        if keys is None:
+            keys = list(map(key, items))
+        self._brackets.clear()
+        self._keys, self._values = _merge_sorted(
+            self._keys, self._values, keys, items)
 
     def index_lt(self, key):
-        left = bisect.bisect_left(self._keys, key)
+        left = _bisect_left(self._keys, key)
         if left:
             return left - 1
         msg = f'no item found with key < {key!r}'
         raise ValueError(msg)
 
     def index_le(self, key):
-        right = bisect.bisect_right(self._keys, key)
+        right = _bisect_right(self._keys, key)
         if right:
             return right - 1
         msg = f'no item found with key <= {key!r}'
         raise ValueError(msg)
 
     def index_gt(self, key):
-        right = bisect.bisect_right(self._keys, key)
-        if right != len(self):
+        keys = self._keys
+        right = _bisect_right(keys, key)
+        if right != len(keys):
             return right
-        msg = f'no item found with key >= {key!r}'
+        msg = f'no item found with key > {key!r}'
         raise ValueError(msg)
 
     def index_ge(self, key):
-        left = bisect.bisect_left(self._keys, key)
-        if left != len(self):
+        keys = self._keys
+        left = _bisect_left(keys, key)
+        if left != len(keys):
             return left
-        msg = f'no item found with key > {key!r}'
+        msg = f'no item found with key >= {key!r}'
         raise ValueError(msg)
 
     def find_lt(self, key):
@@ -15,42 +15,87 @@ import litecore.sets.mixins
 log = logging.getLogger(__name__)
 
 
+# Placeholder left in the item list by discarded items, until compaction
+_TOMBSTONE = object()
+
+
 class IndexedSet(
         litecore.sets.mixins.SetMethodsMixin,
         collections.abc.MutableSet,
         collections.abc.Sequence,
 ):
+    """Set which remembers insertion order and supports indexing.
+
+    Discarded items leave a tombstone in the item list, rather than shifting
+    the positions of all later items. The list is compacted when tombstones
+    make up a quarter of it, or when a position is next needed.
+
+    Examples:
+
+    >>> s = IndexedSet('abcdab')
+    >>> s
+    IndexedSet(['a', 'b', 'c', 'd'])
+    >>> s.discard('b')
+    >>> len(s), list(s), list(reversed(s))
+    (3, ['a', 'c', 'd'], ['d', 'c', 'a'])
+    >>> s.index('d'), s[1]
+    (2, 'c')
+    >>> s.discard('d')
+    >>> s.pop()
+    'c'
+    >>> s.add('e')
+    >>> s
+    IndexedSet(['a', 'e'])
+
+    """
+
     def __init__(self, iterable: Optional[Iterable[Hashable]] = None) -> None:
         self._update(iterable)
 
     def _update(self, items: Iterable):
         if items:
-            self._items = list(items)
-            self._map = {item: index for index, item in enumerate(items)}
+            self._items = list(dict.fromkeys(items))
+            self._map = {item: index for index, item in enumerate(self._items)}
         else:
             self._items = []
             self._map = {}
+        self._tombstones = 0
+
+    def _compact(self) -> None:
+        if self._tombstones:
+            self._update([item for item in self._items if item is not _TOMBSTONE])
+
+    def _live_items(self) -> list:
+        self._compact()
+        return self._items
 
     def __repr__(self) -> str:
-        return f'{type(self).__name__}({self._items!r})'
+        return f'{type(self).__name__}({self._live_items()!r})'
 
     def __len__(self) -> int:
-        return len(self._items)
+        return len(self._items) - self._tombstones
 
     def __contains__(self, key: Hashable) -> bool:
         return key in self._map
 
     def __iter__(self) -> Iterator[Hashable]:
+        if self._tombstones:
+            return (item for item in self._items if item is not _TOMBSTONE)
         return iter(self._items)
 
     def __reversed__(self) -> Iterator[Hashable]:
+        if self._tombstones:
+            return (
+                item for item in reversed(self._items)
+                if item is not _TOMBSTONE
+            )
         return reversed(self._items)
 
     def __getitem__(
             self,
             index_or_slice: Union[int, slice],
     ) -> Union[Hashable, 'OrderedSet']:  # TODO: fix typing
-        items = self._items[index_or_slice]
+        items = self._live_items()[index_or_slice]
         if isinstance(items, list):
             return type(self)(items)
         else:
@@ -67,17 +112,20 @@ class IndexedSet(
             return self._map.keys() == other
 
     def __getstate__(self):
-        return (self._items,)
+        return (self._live_items(),)
 
     def __setstate__(self, state):
         self._update(state[0])
 
     def __copy__(self):
-        return type(self)(self._items)
+        return type(self)(self._live_items())
 
     def __deepcopy__(self):
         import copy
-        return type(self)(copy.deepcopy(self._items))
+        return type(self)(copy.deepcopy(self._live_items()))
+
+    def copy(self):
+        return self.__copy__()
 
     def add(self, key: Hashable) -> None:
         if key not in self._map:
@@ -85,26 +133,30 @@ class IndexedSet(
             self._items.append(key)
 
     def discard(self, key: Hashable) -> None:
-        if key in self._map:
-            index = self._map[key]
-            del self._items[index]
-            del self._map[key]
-            for k, v in self._map.items():
-                if v >= index:
-                    self._map[k] = v - 1
+        index = self._map.pop(key, None)
+        if index is not None:
+            self._items[index] = _TOMBSTONE
+            self._tombstones += 1
+            if self._tombstones * 4 > len(self._items):
+                self._compact()
 
     def clear(self) -> None:
         self._items.clear()
         self._map.clear()
+        self._tombstones = 0
 
     def pop(self) -> Hashable:
-        item = self._items[-1]
-        del self._items[-1]
+        items = self._items
+        while items and items[-1] is _TOMBSTONE:
+            items.pop()
+            self._tombstones -= 1
+        item = items.pop()
         del self._map[item]
         return item
 
     def index(self, key: Hashable) -> int:
         try:
+            self._compact()
             return self._map[key]
         except KeyError:
             msg = f'{key!r} is not in items'
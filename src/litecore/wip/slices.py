@@ -77,12 +77,27 @@ def slice_indices(
         stop: Optional[int] = None,
         step: Optional[int] = None,
 ) -> Iterator[int]:
-    start, stop, step = adjust_args(
-        length=length, start=start, stop=stop, step=step)
-    index = start
-    while (index > stop) if step < 0 else (index < stop):
-        yield index
-        index += step
+    """Iterate over the indices selected by slice arguments.
+
+    Examples:
+
+    >>> list(slice_indices(length=10, start=2, stop=-2, step=3))
+    [2, 5]
+    >>> list(slice_indices(length=5, step=-2))
+    [4, 2, 0]
+    >>> list(slice_indices(length=5, start=-10, stop=20))
+    [0, 1, 2, 3, 4]
+    >>> list(slice_indices(length=5, step=0))
+    Traceback (most recent call last):
+     ...
+    ValueError: step cannot be 0
+
+    """
+    if step == 0:
+        raise ValueError('step cannot be 0')
+    # Slicing a range clamps the endpoints just like adjust_args(), but
+    # without any Python-level branching
+    return iter(range(length)[start:stop:step])
 
 
 def iter_slice(
@@ -92,6 +107,14 @@ def iter_slice(
         stop: Optional[int] = None,
         step: Optional[int] = None,
 ) -> Iterator[Any]:
-    for index in slice_indices(
-            length=len(sequence), start=start, stop=stop, step=step):
-        yield sequence[index]
+    """Iterate over a slice of a sequence without copying it.
+
+    Examples:
+
+    >>> list(iter_slice('abcdef', start=1, step=2))
+    ['b', 'd', 'f']
+
+    """
+    indices = slice_indices(
+        length=len(sequence), start=start, stop=stop, step=step)
+    return map(sequence.__getitem__, indices)
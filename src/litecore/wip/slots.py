@@ -1,7 +1,5 @@
 import dataclasses
 import dis
-import inspect
-import itertools
 
 from typing import (
     Any,
@@ -9,11 +7,23 @@ from typing import (
     List,
 )
 
+import litecore.objtype
+
 
 def all_slots(class_obj: Any) -> List[str]:
-    slots = itertools.chain.from_iterable(
-        getattr(cls, '__slots__', ()) for cls in inspect.getmro(class_obj))
-    return sorted(set(slots))
+    """Return the sorted names of the slots of a class and its bases.
+
+    Examples:
+
+    >>> class A:
+    ...     __slots__ = ('b', 'a')
+    >>> class B(A):
+    ...     __slots__ = 'c'
+    >>> all_slots(B)
+    ['a', 'b', 'c']
+
+    """
+    return sorted(set(litecore.objtype.slot_names(class_obj)))
 
 
 def slotted_fields(
@@ -22,25 +32,47 @@ def slotted_fields(
         with_dict: bool = False,
         with_weakref: bool = False,
 ):
+    """Class decorator adding __slots__ for the fields of a dataclass.
+
+    Examples:
+
+    >>> @slotted_fields
+    ... @dataclasses.dataclass
+    ... class Point:
+    ...     x: int
+    ...     y: int = 0
+    >>> Point.__slots__
+    ('x', 'y')
+    >>> p = Point(1)
+    >>> p
+    Point(x=1, y=0)
+    >>> hasattr(p, '__dict__')
+    False
+
+    """
     def decorator(cls):
         if '__slots__' in cls.__dict__:
             msg = f'{cls.__name__} already has __slots__'
             raise TypeError(msg)
-        cls_dict = dict(cls.__dict__)
-        field_names = list(f.name for f in dataclasses.fields(cls))
+        field_names = [f.name for f in dataclasses.fields(cls)]
         if with_dict:
             # TODO: check if any mro class has dict???
             # https://github.com/cjrh/autoslot/blob/master/autoslot.py
             field_names.append('__dict__')
         if with_weakref:
             field_names.append('__weakref__')
+        # Build the new namespace in one pass, leaving out the field
+        # defaults (which would clash with the slots) and the descriptors
+        # for the old instance __dict__ and __weakref__
+        skip = set(field_names)
+        skip.update(('__dict__', '__weakref__'))
+        cls_dict = {
+            name: value for name, value in cls.__dict__.items()
+            if name not in skip
+        }
         cls_dict['__slots__'] = tuple(field_names)
-        for name in field_names:
-            cls_dict.pop(name, None)
-        cls_dict.pop('__dict__', None)
-        cls_dict.pop('__weakref__', None)
-        cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
         qualname = getattr(cls, '__qualname__', None)
+        cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
         if qualname is not None:
             cls.__qualname__ = qualname
         return cls
@@ -48,14 +80,59 @@ def slotted_fields(
     return decorator if _cls is None else decorator(_cls)
 
 
+# Opcodes loading a local (or closure) variable, including the combined
+# and specialized forms of newer Python versions (e.g., LOAD_FAST_LOAD_FAST)
+_LOAD_VARIABLE_PREFIXES = ('LOAD_FAST', 'LOAD_DEREF')
+# Opcodes around the attribute read of an augmented assignment
+_DUPLICATE_TOP_OPS = frozenset(('DUP_TOP', 'COPY'))
+_SWAP_TOP_OPS = frozenset(('ROT_TWO', 'SWAP'))
+
+
+def _loads_last(instruction: dis.Instruction, name: str) -> bool:
+    if not instruction.opname.startswith(_LOAD_VARIABLE_PREFIXES):
+        return False
+    argval = instruction.argval
+    if isinstance(argval, tuple):
+        # combined loads push their variables in order
+        argval = argval[-1]
+    return argval == name
+
+
 def assigned_attributes(method: Callable) -> List[str]:
-    bytecode = dis.Bytecode(method)
-    it1, it2 = itertools.tee(bytecode)
-    next(it2, None)
-    self_var = next(iter(method.__code__.co_varnames))
+    """Return the sorted names of the attributes a method sets on self.
+
+    Examples:
+
+    >>> class Point:
+    ...     def __init__(self, x, y):
+    ...         self.y = y
+    ...         self.x = x
+    ...         self.count = 0
+    ...         self.count += 1
+    ...         other = x
+    ...         other.z = 0
+    >>> assigned_attributes(Point.__init__)
+    ['count', 'x', 'y']
+
+    """
+    self_var = method.__code__.co_varnames[0]
+    instructions = list(dis.get_instructions(method))
     attrs = set()
-    for first, second in zip(it1, it2):
-        if (first.argval == self_var and (
-                first.opname, second.opname == ('LOAD_FAST', 'STORE_ATTR'))):
-            attrs.add(second.argval)
+    augmented = set()
+    for index, instruction in enumerate(instructions):
+        if index == 0:
+            continue
+        previous = instructions[index - 1]
+        if instruction.opname == 'LOAD_ATTR':
+            # Augmented assignment reads the attribute from a copy of self
+            if (index > 1 and previous.opname in _DUPLICATE_TOP_OPS
+                    and _loads_last(instructions[index - 2], self_var)):
+                augmented.add(instruction.argval)
+        elif instruction.opname == 'STORE_ATTR':
+            # The object stored to is the last value pushed, or (for
+            # augmented assignment) swapped back to the top of the stack
+            if _loads_last(previous, self_var) or (
+                    previous.opname in _SWAP_TOP_OPS
+                    and instruction.argval in augmented):
+                attrs.add(instruction.argval)
     return sorted(attrs)
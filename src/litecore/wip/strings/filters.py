@@ -12,23 +12,75 @@ DEFAULT_TRANS_TABLE = str.maketrans(
 )
 
 
+# Deletes the non-alphabetic characters in the Latin-1 range
+_LATIN1_NON_ALPHA_TRANS_TABLE = str.maketrans(
+    '', '', ''.join(c for c in map(chr, range(256)) if not c.isalpha())
+)
+
+
 def only_alpha(s: str) -> str:
-    return ''.join(filter, str.isalpha, s)
+    """Remove all non-alphabetic characters from a string.
+
+    Examples:
+
+    >>> only_alpha('abc, 123 déf!')
+    'abcdéf'
+    >>> only_alpha('x\u2014y\u00bd')
+    'xy'
+    >>> only_alpha('')
+    ''
+
+    """
+    # Usually a single translate pass does it; only strings with other
+    # non-alphabetic characters are filtered character by character
+    result = s.translate(_LATIN1_NON_ALPHA_TRANS_TABLE)
+    if not result or result.isalpha():
+        return result
+    return ''.join(filter(str.isalpha, result))
 
 
 def only_alpha_numeric(s: str) -> str:
     return ''.join(filter(str.isalnum, s))
 
 
+# The whitespace functions below deliberately use split() and join():
+# both run entirely in C, and measure several times faster than an
+# equivalent precompiled re.sub(r'\s+', ...) on short and long strings.
+
+
 def strip_ws(s: str) -> str:
+    """Remove all whitespace from a string.
+
+    Examples:
+
+    >>> strip_ws(' a b\\t\\nc ')
+    'abc'
+
+    """
     return ''.join(s.split())
 
 
 def ws_to_us(s: str) -> str:
+    """Replace each run of whitespace with an underscore, trimming the ends.
+
+    Examples:
+
+    >>> ws_to_us('  snake  case\\n')
+    'snake_case'
+
+    """
     return '_'.join(s.split())
 
 
 def ws_to_dash(s: str) -> str:
+    """Replace each run of whitespace with a dash, trimming the ends.
+
+    Examples:
+
+    >>> ws_to_dash('kebab\\u00a0case')
+    'kebab-case'
+
+    """
     return '-'.join(s.split())
 
 